@@ -1,25 +1,65 @@
-"""ODT Common Library - Shared models and utilities."""
+"""ODT Common Library - Shared models and utilities.
+
+Public names are resolved lazily (PEP 562) so that importing a single symbol,
+e.g. ``from odt_common import Task``, only loads the submodule that defines it.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
-from odt_common.config import (
-    AppConfig,
-    CalibratorConfig,
-    DcMockConfig,
-    DynamicConfigEvent,
-    GlobalConfig,
-    ServicesConfig,
-    SimulatorConfig,
-    WorkloadContext,
-    load_config_from_env,
-)
-from odt_common.models import Consumption, Fragment, Task, Topology, TopologySnapshot
-from odt_common.result_cache import ResultCache
-from odt_common.task_accumulator import TaskAccumulator
+if TYPE_CHECKING:
+    from odt_common.config import (
+        AppConfig,
+        CalibratorConfig,
+        DcMockConfig,
+        DynamicConfigEvent,
+        GlobalConfig,
+        ServicesConfig,
+        SimulatorConfig,
+        WorkloadContext,
+        load_config_from_env,
+    )
+    from odt_common.models import (
+        Consumption,
+        Fragment,
+        FragmentRecord,
+        Task,
+        TaskRecord,
+        Topology,
+        TopologySnapshot,
+    )
+    from odt_common.result_cache import ResultCache
+    from odt_common.task_accumulator import TaskAccumulator
 
-__all__ = [
+# Public name -> defining module
+_LAZY_EXPORTS = {
+    "Task": "odt_common.models",
+    "TaskRecord": "odt_common.models",
+    "Fragment": "odt_common.models",
+    "FragmentRecord": "odt_common.models",
+    "Consumption": "odt_common.models",
+    "Topology": "odt_common.models",
+    "TopologySnapshot": "odt_common.models",
+    "AppConfig": "odt_common.config",
+    "GlobalConfig": "odt_common.config",
+    "ServicesConfig": "odt_common.config",
+    "DcMockConfig": "odt_common.config",
+    "SimulatorConfig": "odt_common.config",
+    "CalibratorConfig": "odt_common.config",
+    "WorkloadContext": "odt_common.config",
+    "DynamicConfigEvent": "odt_common.config",
+    "load_config_from_env": "odt_common.config",
+    "ResultCache": "odt_common.result_cache",
+    "TaskAccumulator": "odt_common.task_accumulator",
+}
+
+__all__ = (
     "Task",
+    "TaskRecord",
     "Fragment",
+    "FragmentRecord",
     "Consumption",
     "Topology",
     "TopologySnapshot",
@@ -34,4 +74,20 @@ __all__ = [
     "load_config_from_env",
     "ResultCache",
     "TaskAccumulator",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily exported names alongside loaded module attributes."""
+    return sorted({*globals(), *__all__})
@@ -6,12 +6,70 @@ This module provides:
 3. Path resolution based on workload names
 """
 
+import copy
+import os
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Parsed YAML files keyed by absolute path, invalidated on (mtime_ns, size) change
+_YAML_CACHE_MAX_ENTRIES = 100
+_yaml_cache: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _yaml() -> tuple[ModuleType, type, type]:
+    """Import PyYAML on first use (keeps it off the package import path).
+
+    Returns:
+        The yaml module and its safe loader/dumper, preferring the libyaml C
+        bindings and falling back to pure Python if PyYAML was built without them
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged.
+
+    Callers get a deep copy so mutating the result never corrupts the cache.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    key = str(path.resolve())
+    stat = path.stat()
+
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+    yaml, loader, _ = _yaml()
+    with open(path) as f:
+        data = yaml.load(f, Loader=loader)
+
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _yaml_cache.move_to_end(key)
+        while len(_yaml_cache) > _YAML_CACHE_MAX_ENTRIES:
+            _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(data)
+
 
 class KafkaTopicConfig(BaseModel):
     """Configuration for a single Kafka topic."""
@@ -23,6 +81,10 @@ class KafkaTopicConfig(BaseModel):
         default_factory=dict, description="Key-value pairs for topic properties"
     )
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class KafkaConfig(BaseModel):
     """Kafka infrastructure configuration."""
@@ -48,6 +110,10 @@ class GlobalConfig(BaseModel):
             raise ValueError("speed_factor must be positive or -1 (max speed)")
         return v
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class DcMockConfig(BaseModel):
     """DC-Mock service configuration."""
@@ -59,6 +125,10 @@ class DcMockConfig(BaseModel):
         gt=0,
     )
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class SimulatorConfig(BaseModel):
     """Simulator service configuration."""
@@ -72,6 +142,10 @@ class SimulatorConfig(BaseModel):
         ge=0,
     )
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class CalibratorConfig(BaseModel):
     """Calibrator service configuration."""
@@ -101,16 +175,24 @@ class CalibratorConfig(BaseModel):
     asym_util_max: float | None = Field(None, exclude=True)
     asym_util_points: int | None = Field(None, exclude=True)
 
-    @model_validator(mode="after")
-    def handle_legacy_fields(self):
+    @model_validator(mode="before")
+    @classmethod
+    def handle_legacy_fields(cls, data: Any) -> Any:
         """Map legacy field names to new ones if present."""
-        if self.asym_util_min is not None:
-            self.min_value = self.asym_util_min
-        if self.asym_util_max is not None:
-            self.max_value = self.asym_util_max
-        if self.asym_util_points is not None:
-            self.linspace_points = self.asym_util_points
-        return self
+        if isinstance(data, dict):
+            data = dict(data)
+            for legacy, field in (
+                ("asym_util_min", "min_value"),
+                ("asym_util_max", "max_value"),
+                ("asym_util_points", "linspace_points"),
+            ):
+                if data.get(legacy) is not None:
+                    data[field] = data[legacy]
+        return data
+
+    class Config:
+        frozen = True
+        extra = "forbid"
 
 
 class ServicesConfig(BaseModel):
@@ -138,13 +220,12 @@ class WorkloadMetadata(BaseModel):
     @classmethod
     def load(cls, path: Path) -> "WorkloadMetadata":
         """Load workload metadata from YAML file."""
-        if not path.exists():
+        try:
+            data = _load_yaml_cached(path)
+        except FileNotFoundError:
             # Return default if file doesn't exist
             return cls(name=path.parent.name)
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
         # Extract relevant fields
         timestamps = data.get("timestamps", {})
         return cls(
@@ -153,60 +234,73 @@ class WorkloadMetadata(BaseModel):
             consumption_offset_ms=timestamps.get("consumption_offset_ms", 0),
         )
 
+    class Config:
+        frozen = True
+        extra = "forbid"
+
 
 class WorkloadContext(BaseModel):
-    """Workload context with resolved file paths."""
+    """Workload context with resolved file paths.
+
+    Paths and metadata are resolved on first use and memoized; treat the fields
+    as read-only after construction.
+    """
 
     name: str = Field(default="", description="Workload name (e.g., 'SURF')")
     base_path: Path = Field(default=Path("/app/workload"), description="Base workload directory")
     workload_dir: Path | None = Field(
         None, description="Direct path to workload directory (overrides base_path/name)"
     )
-    metadata: WorkloadMetadata | None = Field(None, description="Workload metadata")
-
-    def __init__(self, **data):
-        """Initialize and load metadata if not provided."""
-        super().__init__(**data)
-        if self.metadata is None and self.workload_config_file.exists():
-            self.metadata = WorkloadMetadata.load(self.workload_config_file)
+    metadata: WorkloadMetadata | None = Field(
+        None, description="Workload metadata (loaded from workload.yaml on first use if omitted)"
+    )
 
-    @property
+    @cached_property
     def _resolved_workload_dir(self) -> Path:
         """Get resolved workload directory path."""
         if self.workload_dir is not None:
             return self.workload_dir
         return self.base_path / self.name
 
-    @property
+    @cached_property
     def tasks_file(self) -> Path:
         """Path to tasks.parquet file."""
         return self._resolved_workload_dir / "tasks.parquet"
 
-    @property
+    @cached_property
     def fragments_file(self) -> Path:
         """Path to fragments.parquet file."""
         return self._resolved_workload_dir / "fragments.parquet"
 
-    @property
+    @cached_property
     def consumption_file(self) -> Path:
         """Path to consumption.parquet file."""
         return self._resolved_workload_dir / "consumption.parquet"
 
-    @property
+    @cached_property
     def topology_file(self) -> Path:
         """Path to topology.json file."""
         return self._resolved_workload_dir / "topology.json"
 
-    @property
+    @cached_property
     def workload_config_file(self) -> Path:
         """Path to workload configuration file."""
         return self._resolved_workload_dir / "workload.yaml"
 
+    @cached_property
+    def _workload_metadata(self) -> WorkloadMetadata | None:
+        """Explicit metadata, else workload.yaml loaded on first access (None if absent)."""
+        if self.metadata is not None:
+            return self.metadata
+        if self.workload_config_file.exists():
+            return WorkloadMetadata.load(self.workload_config_file)
+        return None
+
     @property
     def consumption_offset_ms(self) -> int:
         """Get consumption timestamp offset in milliseconds."""
-        if self.metadata:
-            return self.metadata.consumption_offset_ms
+        if self._workload_metadata:
+            return self._workload_metadata.consumption_offset_ms
         return 0
 
     def exists(self) -> bool:
@@ -214,12 +308,18 @@ class WorkloadContext(BaseModel):
         return self._resolved_workload_dir.exists()
 
     def get_file_status(self) -> dict[str, bool]:
-        """Check which workload files exist."""
+        """Check which workload files exist (one directory scan instead of a stat per file)."""
+        try:
+            with os.scandir(self._resolved_workload_dir) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            names = set()
+
         return {
-            "tasks": self.tasks_file.exists(),
-            "fragments": self.fragments_file.exists(),
-            "consumption": self.consumption_file.exists(),
-            "topology": self.topology_file.exists(),
+            "tasks": self.tasks_file.name in names,
+            "fragments": self.fragments_file.name in names,
+            "consumption": self.consumption_file.name in names,
+            "topology": self.topology_file.name in names,
         }
 
     class Config:
@@ -287,8 +387,7 @@ class AppConfig(BaseModel):
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml_cached(config_path)
 
         if not data:
             raise ValueError(f"Empty or invalid YAML in {config_path}")
@@ -304,8 +403,15 @@ class AppConfig(BaseModel):
         config_path = Path(path)
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
+        yaml, _, dumper = _yaml()
         with open(config_path, "w") as f:
-            yaml.safe_dump(self.model_dump(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                self.model_dump(),
+                f,
+                Dumper=dumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
@@ -348,30 +454,65 @@ class DynamicConfigEvent(BaseModel):
             ValueError: If setting_key is invalid
         """
         # Parse the setting key (e.g., "simulation.speed_factor")
-        parts = self.setting_key.split(".")
+        parts = _split_setting_key(self.setting_key)
 
         if len(parts) < 2:
             raise ValueError(f"Invalid setting_key: {self.setting_key}")
 
-        # Create a new config with the updated value
-        config_dict = config.to_dict()
+        # Only models along the path are copied and re-validated; sibling branches
+        # are shared with the original config
+        return _replace_setting(config, parts, self.new_value, self.setting_key)
+
+
+@lru_cache(maxsize=256)
+def _split_setting_key(setting_key: str) -> tuple[str, ...]:
+    """Split a dot-notation setting key into its parts (cached per key)."""
+    return tuple(setting_key.split("."))
 
-        # Navigate to the nested setting
-        target = config_dict
-        for part in parts[:-1]:
-            if part not in target:
-                raise ValueError(f"Invalid setting path: {self.setting_key}")
-            target = target[part]
 
-        # Update the value
-        final_key = parts[-1]
-        if final_key not in target:
-            raise ValueError(f"Invalid setting key: {self.setting_key}")
+def _replace_setting(node: Any, parts: tuple[str, ...], new_value: Any, setting_key: str) -> Any:
+    """Return a copy of node with the value at the dotted path replaced.
 
-        target[final_key] = self.new_value
+    Each mutable model on the path is shallow-copied and the changed field is validated
+    via assignment; frozen models are rebuilt from their fields. Either way the field
+    and model validators of every enclosing model still run.
 
-        # Return new config instance
-        return AppConfig(**config_dict)
+    Args:
+        node: Model or dict at the current level
+        parts: Remaining path parts (non-empty)
+        new_value: Value to set at the end of the path
+        setting_key: Full setting key (for error messages)
+
+    Returns:
+        Updated copy of node
+
+    Raises:
+        ValueError: If the path does not exist or the new value is invalid
+    """
+    part, rest = parts[0], parts[1:]
+
+    if isinstance(node, BaseModel):
+        exists = part in type(node).model_fields
+    else:
+        exists = isinstance(node, dict) and part in node
+    if not exists:
+        if rest:
+            raise ValueError(f"Invalid setting path: {setting_key}")
+        raise ValueError(f"Invalid setting key: {setting_key}")
+
+    if isinstance(node, BaseModel):
+        child = getattr(node, part)
+        value = _replace_setting(child, rest, new_value, setting_key) if rest else new_value
+        if type(node).model_config.get("frozen"):
+            # Frozen configs are small leaves: re-validate them from their fields
+            return type(node).model_validate({**node.model_dump(), part: value})
+        updated = node.model_copy()
+        type(node).__pydantic_validator__.validate_assignment(updated, part, value)
+        return updated
+
+    child = node[part]
+    value = _replace_setting(child, rest, new_value, setting_key) if rest else new_value
+    return {**node, part: value}
 
 
 # Convenience function for loading config from environment
@@ -388,8 +529,6 @@ def load_config_from_env(env_var: str = "CONFIG_FILE") -> AppConfig:
         ValueError: If environment variable not set
         FileNotFoundError: If config file doesn't exist
     """
-    import os
-
     config_path = os.getenv(env_var)
     if not config_path:
         raise ValueError(f"Environment variable {env_var} not set")
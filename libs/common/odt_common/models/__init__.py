@@ -1,8 +1,8 @@
-"""Shared Pydantic models for ODT."""
+"""Shared Pydantic models (and slotted in-memory records) for ODT."""
 
 from odt_common.models.consumption import Consumption
-from odt_common.models.fragment import Fragment
-from odt_common.models.task import Task
+from odt_common.models.fragment import Fragment, FragmentRecord
+from odt_common.models.task import Task, TaskRecord
 from odt_common.models.topology import (
     CPU,
     Cluster,
@@ -14,12 +14,11 @@ from odt_common.models.topology import (
 )
 from odt_common.models.workload_message import WorkloadMessage
 
-# Update forward references for Task.fragments
-Task.model_rebuild()
-
 __all__ = [
     "Task",
+    "TaskRecord",
     "Fragment",
+    "FragmentRecord",
     "Consumption",
     "Topology",
     "TopologySnapshot",
@@ -0,0 +1,127 @@
+"""Column-wise coercion of parquet data for trusted model construction.
+
+The model validators (ID prefix stripping, epoch ms to UTC datetime) run once per
+row. These helpers apply the same conversions to whole Arrow columns so rows can
+be built with ``from_row`` without validation.
+"""
+
+from datetime import datetime
+
+import annotated_types
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import BaseModel
+
+# Fixed UTC offset; pyarrow converts it to datetime.UTC on to_pylist()
+_UTC_TIMESTAMP = pa.timestamp("ms", tz="+00:00")
+
+
+def task_ids_from_arrow(column: pa.Array | pa.ChunkedArray) -> list[int]:
+    """Convert an ID column ("task-123", "123" or 123) to Python ints.
+
+    Args:
+        column: Arrow column of string or integer task IDs
+
+    Returns:
+        List of integer task IDs
+    """
+    if pa.types.is_integer(column.type):
+        return column.to_pylist()
+    stripped = pc.replace_substring_regex(column, pattern="^task-", replacement="")
+    return pc.cast(stripped, pa.int64()).to_pylist()
+
+
+def utc_datetimes_from_arrow(column: pa.Array | pa.ChunkedArray) -> list[datetime]:
+    """Convert a timestamp or epoch-milliseconds column to UTC-aware datetimes.
+
+    Naive timestamps are interpreted as UTC, matching the model validators.
+
+    Args:
+        column: Arrow timestamp column, or numeric column of epoch milliseconds
+
+    Returns:
+        List of UTC-aware datetimes
+    """
+    if not pa.types.is_timestamp(column.type):
+        column = pc.cast(column, pa.int64(), safe=False)
+    return pc.cast(column, _UTC_TIMESTAMP).to_pylist()
+
+
+def check_field_bounds(table: pa.Table, model: type[BaseModel]) -> None:
+    """Enforce a model's ``ge``/``gt`` field constraints on whole table columns.
+
+    One vectorized min() per constrained column replaces the per-row checks that
+    ``from_row`` skips.
+
+    Args:
+        table: Arrow table whose column names match the model's field names
+        model: Pydantic model declaring the constraints
+
+    Raises:
+        ValueError: If a column holds nulls or a value below its bound
+    """
+    for name, field in model.model_fields.items():
+        if name not in table.column_names:
+            continue
+        for constraint in field.metadata:
+            if isinstance(constraint, annotated_types.Ge):
+                bound, below = constraint.ge, pc.less
+            elif isinstance(constraint, annotated_types.Gt):
+                bound, below = constraint.gt, pc.less_equal
+            else:
+                continue
+
+            column = table[name]
+            if column.null_count:
+                raise ValueError(f"Column '{name}' contains {column.null_count} null value(s)")
+            minimum = pc.min(column).as_py()
+            if minimum is not None and below(minimum, bound).as_py():
+                raise ValueError(
+                    f"Column '{name}' has value {minimum} out of bounds for {model.__name__}"
+                )
+
+
+# String IDs the model validators accept: "123" or "task-123"
+_TASK_ID_PATTERN = r"^(task-)?[+-]?\d+$"
+
+
+def drop_invalid_rows(table: pa.Table, model: type[BaseModel]) -> tuple[pa.Table, int]:
+    """Drop the rows that the model's per-row validation would reject.
+
+    Nulls in required columns, values outside ``ge``/``gt`` bounds (including NaN)
+    and unparseable string IDs are masked column-wise, so the remaining rows pass
+    ``check_field_bounds`` and can be built without validation.
+
+    Args:
+        table: Arrow table whose column names match the model's field names or aliases
+        model: Pydantic model declaring the constraints
+
+    Returns:
+        Tuple of (table with only valid rows, number of dropped rows)
+    """
+    valid = None
+    for name, field in model.model_fields.items():
+        column_name = field.alias or name
+        if column_name not in table.column_names:
+            continue
+
+        column = table[column_name]
+        checks = [pc.is_valid(column)] if field.is_required() else []
+        for constraint in field.metadata:
+            if isinstance(constraint, annotated_types.Ge):
+                checks.append(pc.greater_equal(column, constraint.ge))
+            elif isinstance(constraint, annotated_types.Gt):
+                checks.append(pc.greater(column, constraint.gt))
+        if column_name == "id" and pa.types.is_string(column.type):
+            checks.append(pc.match_substring_regex(column, pattern=_TASK_ID_PATTERN))
+
+        for check in checks:
+            # Nulls in a comparison mean "invalid" (fill_null), not "unknown"
+            check = pc.fill_null(check, False)
+            valid = check if valid is None else pc.and_(valid, check)
+
+    if valid is None or pc.all(valid).as_py():
+        return table, 0
+
+    filtered = table.filter(valid)
+    return filtered, table.num_rows - filtered.num_rows
@@ -1,8 +1,14 @@
 """Consumption model from consumption.parquet."""
 
-from datetime import UTC, datetime
+from datetime import datetime
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+from .types import UtcDatetime
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 class Consumption(BaseModel):
@@ -16,35 +22,53 @@ class Consumption(BaseModel):
 
     power_draw: float = Field(..., description="Power consumption in watts", ge=0)
     energy_usage: float = Field(..., description="Energy consumed in joules", ge=0)
-    timestamp: datetime = Field(..., description="Absolute timestamp of measurement")
+    timestamp: UtcDatetime = Field(..., description="Absolute timestamp of measurement")
 
-    @field_validator("timestamp", mode="before")
     @classmethod
-    def parse_timestamp(cls, v: datetime | int | float | str) -> datetime:
-        """Parse timestamp from epoch milliseconds to datetime (UTC-aware).
+    def from_row(cls, power_draw: float, energy_usage: float, timestamp: datetime) -> "Consumption":
+        """Build a Consumption record from trusted, pre-coerced parquet values.
+
+        Skips validation; the timestamp must already be a UTC-aware datetime.
 
         Args:
-            v: Timestamp as milliseconds (int/float), datetime object, or ISO string
+            power_draw: Power consumption in watts
+            energy_usage: Energy consumed in joules
+            timestamp: UTC-aware measurement timestamp
 
         Returns:
-            UTC-aware datetime object
+            Unvalidated Consumption instance
         """
-        if isinstance(v, (int, float)):
-            # Convert milliseconds to seconds for datetime, make it UTC-aware
-            return datetime.fromtimestamp(v / 1000.0, tz=UTC)
-        elif isinstance(v, str):
-            # Parse ISO format string
-            dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
-            # Ensure UTC if not already timezone-aware
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=UTC)
-            return dt
-        elif isinstance(v, datetime):
-            # If already datetime but naive, make it UTC
-            if v.tzinfo is None:
-                return v.replace(tzinfo=UTC)
-            return v
-        return v
+        return cls.model_construct(
+            power_draw=power_draw, energy_usage=energy_usage, timestamp=timestamp
+        )
+
+    @classmethod
+    def from_arrow_table(cls, table: "pa.Table") -> list["Consumption"]:
+        """Build Consumption records in bulk from an Arrow table.
+
+        Args:
+            table: Arrow table with power_draw, energy_usage and absolute timestamp
+                (timestamp type or epoch milliseconds) columns
+
+        Returns:
+            List of Consumption records in table order
+
+        Raises:
+            ValueError: If a column violates the model's field constraints
+        """
+        from .columns import check_field_bounds, utc_datetimes_from_arrow
+
+        check_field_bounds(table, cls)
+
+        return [
+            cls.from_row(power_draw=power_draw, energy_usage=energy_usage, timestamp=timestamp)
+            for power_draw, energy_usage, timestamp in zip(
+                table["power_draw"].to_pylist(),
+                table["energy_usage"].to_pylist(),
+                utc_datetimes_from_arrow(table["timestamp"]),
+                strict=True,
+            )
+        ]
 
     @property
     def energy_usage_kwh(self) -> float:
@@ -60,6 +84,7 @@ class Consumption(BaseModel):
         return self.power_draw / 1000.0
 
     class Config:
+        frozen = True  # Read-only parquet/Kafka record; also makes records hashable
         json_schema_extra = {
             "example": {
                 "power_draw": 250.5,
@@ -1,7 +1,13 @@
 """Fragment model from fragments.parquet."""
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, Field, field_validator
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class Fragment(BaseModel):
     """Represents a workload fragment.
@@ -23,12 +29,55 @@ class Fragment(BaseModel):
     def parse_id(cls, v: str | int) -> int:
         """Parse task ID from string to int."""
         if isinstance(v, str):
-            # Handle "task-123" -> 123
-            if "task-" in v:
-                return int(v.split("-")[1])
-            return int(v)
+            # Handle "task-123" -> 123 (same rule as the columnar loaders)
+            return int(v.removeprefix("task-"))
         return v
 
+    @classmethod
+    def from_row(cls, task_id: int, duration: int, cpu_count: int, cpu_usage: float) -> "Fragment":
+        """Build a Fragment from trusted, pre-coerced parquet values without validation.
+
+        Args:
+            task_id: Integer task ID (already stripped of any "task-" prefix)
+            duration: Fragment duration in milliseconds
+            cpu_count: Number of CPU cores
+            cpu_usage: MHz usage per CPU core
+
+        Returns:
+            Unvalidated Fragment instance
+        """
+        return cls.model_construct(
+            task_id=task_id, duration=duration, cpu_count=cpu_count, cpu_usage=cpu_usage
+        )
+
+    @classmethod
+    def from_arrow_table(cls, table: "pa.Table") -> list["Fragment"]:
+        """Build Fragments in bulk from a fragments.parquet Arrow table.
+
+        Args:
+            table: Arrow table with the fragments.parquet schema
+
+        Returns:
+            List of Fragments in table order
+
+        Raises:
+            ValueError: If a column violates the model's field constraints
+        """
+        from .columns import check_field_bounds, task_ids_from_arrow
+
+        check_field_bounds(table, cls)
+
+        return [
+            cls.from_row(task_id=task_id, duration=duration, cpu_count=cpu_count, cpu_usage=usage)
+            for task_id, duration, cpu_count, usage in zip(
+                task_ids_from_arrow(table["id"]),
+                table["duration"].to_pylist(),
+                table["cpu_count"].to_pylist(),
+                table["cpu_usage"].to_pylist(),
+                strict=True,
+            )
+        ]
+
     @property
     def duration_seconds(self) -> float:
         """Get duration in seconds (convenience property)."""
@@ -41,6 +90,7 @@ class Fragment(BaseModel):
 
     class Config:
         populate_by_name = True  # Allow both 'id' and 'task_id'
+        frozen = True  # Read-only parquet/Kafka record; also makes fragments hashable
         json_schema_extra = {
             "example": {
                 "id": 123,  # Will be mapped to task_id
@@ -49,3 +99,46 @@ class Fragment(BaseModel):
                 "cpu_usage": 1800.0,
             }
         }
+
+
+@dataclass(slots=True, frozen=True)
+class FragmentRecord:
+    """Slotted, immutable in-memory form of a validated Fragment.
+
+    Used for fragments held long-term by services (e.g. the task accumulator);
+    Pydantic models stay at the Kafka/parquet boundary.
+    """
+
+    task_id: int
+    duration: int
+    cpu_count: int
+    cpu_usage: float
+
+    @classmethod
+    def from_pydantic(cls, fragment: Fragment) -> "FragmentRecord":
+        """Create a record from a validated Fragment."""
+        return cls(
+            task_id=fragment.task_id,
+            duration=fragment.duration,
+            cpu_count=fragment.cpu_count,
+            cpu_usage=fragment.cpu_usage,
+        )
+
+    def to_pydantic(self) -> Fragment:
+        """Convert back to a Fragment model (no re-validation)."""
+        return Fragment.from_row(
+            task_id=self.task_id,
+            duration=self.duration,
+            cpu_count=self.cpu_count,
+            cpu_usage=self.cpu_usage,
+        )
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get duration in seconds (convenience property)."""
+        return self.duration / 1000.0
+
+    @property
+    def total_cpu_usage_mhz(self) -> float:
+        """Get total CPU usage in MHz."""
+        return self.cpu_count * self.cpu_usage
@@ -1,14 +1,17 @@
 """Task model from tasks.parquet."""
 
-from datetime import UTC, datetime
-
-# Import Fragment for type hints (avoiding circular import)
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, field_validator
 
+from .fragment import Fragment, FragmentRecord
+from .types import UtcDatetime
+
 if TYPE_CHECKING:
-    from .fragment import Fragment
+    import pyarrow as pa
 
 
 class Task(BaseModel):
@@ -27,53 +30,111 @@ class Task(BaseModel):
     """
 
     id: int = Field(..., description="Unique task identifier")
-    submission_time: datetime = Field(..., description="Task submission timestamp (epoch ms)")
+    submission_time: UtcDatetime = Field(..., description="Task submission timestamp (epoch ms)")
     duration: int = Field(..., description="Task duration in milliseconds", ge=0)
     cpu_count: int = Field(..., description="Number of CPU cores", ge=0)
     cpu_capacity: float = Field(..., description="MHz per CPU core", ge=0)
     mem_capacity: int = Field(..., description="Memory capacity in MB", ge=0)
 
     # AGGREGATION FIELD: Not in Parquet, populated by producer
-    fragments: list["Fragment"] = Field(default_factory=list, description="Child fragments")
+    fragments: list[Fragment] = Field(default_factory=list, description="Child fragments")
 
     @field_validator("id", mode="before")
     @classmethod
     def parse_id(cls, v: str | int) -> int:
         """Parse task ID from string to int."""
         if isinstance(v, str):
-            # Handle "task-123" -> 123
-            if "task-" in v:
-                return int(v.split("-")[1])
-            return int(v)
+            # Handle "task-123" -> 123 (same rule as the columnar loaders)
+            return int(v.removeprefix("task-"))
         return v
 
-    @field_validator("submission_time", mode="before")
     @classmethod
-    def parse_submission_time(cls, v: datetime | int | float | str) -> datetime:
-        """Parse submission time from epoch milliseconds to datetime (UTC-aware).
+    def from_row(
+        cls,
+        id: int,
+        submission_time: datetime,
+        duration: int,
+        cpu_count: int,
+        cpu_capacity: float,
+        mem_capacity: int,
+        fragments: list[Fragment] | None = None,
+    ) -> "Task":
+        """Build a Task from trusted, pre-coerced parquet values without validation.
+
+        Callers are responsible for stripping the "task-" prefix from IDs and converting
+        submission times to UTC-aware datetimes up front (vectorized, at read time).
+        Kafka-ingested data must keep going through the validating constructor.
 
         Args:
-            v: Timestamp as milliseconds (int/float), datetime object, or ISO string
+            id: Integer task ID
+            submission_time: UTC-aware submission time
+            duration: Task duration in milliseconds
+            cpu_count: Number of CPU cores
+            cpu_capacity: MHz per CPU core
+            mem_capacity: Memory capacity in MB
+            fragments: Child fragments (defaults to an empty list)
 
         Returns:
-            UTC-aware datetime object
+            Unvalidated Task instance
         """
-        if isinstance(v, (int, float)):
-            # Convert milliseconds to seconds for datetime, make it UTC-aware
-            return datetime.fromtimestamp(v / 1000.0, tz=UTC)
-        elif isinstance(v, str):
-            # Parse ISO format string
-            dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
-            # Ensure UTC if not already timezone-aware
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=UTC)
-            return dt
-        elif isinstance(v, datetime):
-            # If already datetime but naive, make it UTC
-            if v.tzinfo is None:
-                return v.replace(tzinfo=UTC)
-            return v
-        return v
+        return cls.model_construct(
+            id=id,
+            submission_time=submission_time,
+            duration=duration,
+            cpu_count=cpu_count,
+            cpu_capacity=cpu_capacity,
+            mem_capacity=mem_capacity,
+            fragments=fragments if fragments is not None else [],
+        )
+
+    @classmethod
+    def from_arrow_table(
+        cls,
+        table: "pa.Table",
+        fragments_by_task: Mapping[int, list[Fragment]] | None = None,
+    ) -> list["Task"]:
+        """Build Tasks in bulk from a tasks.parquet Arrow table.
+
+        IDs and submission times are coerced column-wise, then each row is built
+        with ``from_row`` (no per-row validation).
+
+        Args:
+            table: Arrow table with the tasks.parquet schema
+            fragments_by_task: Optional fragments to attach, keyed by task ID
+
+        Returns:
+            List of Tasks in table order
+
+        Raises:
+            ValueError: If a column violates the model's field constraints
+        """
+        from .columns import check_field_bounds, task_ids_from_arrow, utc_datetimes_from_arrow
+
+        check_field_bounds(table, cls)
+
+        if fragments_by_task is None:
+            fragments_by_task = {}
+
+        return [
+            cls.from_row(
+                id=task_id,
+                submission_time=submission_time,
+                duration=duration,
+                cpu_count=cpu_count,
+                cpu_capacity=cpu_capacity,
+                mem_capacity=mem_capacity,
+                fragments=fragments_by_task.get(task_id, []),
+            )
+            for task_id, submission_time, duration, cpu_count, cpu_capacity, mem_capacity in zip(
+                task_ids_from_arrow(table["id"]),
+                utc_datetimes_from_arrow(table["submission_time"]),
+                table["duration"].to_pylist(),
+                table["cpu_count"].to_pylist(),
+                table["cpu_capacity"].to_pylist(),
+                table["mem_capacity"].to_pylist(),
+                strict=True,
+            )
+        ]
 
     @property
     def duration_seconds(self) -> float:
@@ -107,3 +168,67 @@ class Task(BaseModel):
                 "fragments": [],
             }
         }
+
+
+@dataclass(slots=True, frozen=True)
+class TaskRecord:
+    """Slotted, immutable in-memory form of a validated Task.
+
+    Services that keep every task for the lifetime of a run (the task accumulator)
+    store this instead of the Pydantic model: no per-instance ``__dict__`` and
+    cheap construction. Fields and properties mirror ``Task`` so downstream code
+    (e.g. the OpenDC runner) accepts either form.
+    """
+
+    id: int
+    submission_time: datetime
+    duration: int
+    cpu_count: int
+    cpu_capacity: float
+    mem_capacity: int
+    fragments: tuple[FragmentRecord, ...] = ()
+
+    @classmethod
+    def from_pydantic(cls, task: Task) -> "TaskRecord":
+        """Create a record (including fragments) from a validated Task."""
+        return cls(
+            id=task.id,
+            submission_time=task.submission_time,
+            duration=task.duration,
+            cpu_count=task.cpu_count,
+            cpu_capacity=task.cpu_capacity,
+            mem_capacity=task.mem_capacity,
+            fragments=tuple(FragmentRecord.from_pydantic(f) for f in task.fragments),
+        )
+
+    def to_pydantic(self) -> Task:
+        """Convert back to a Task model (no re-validation)."""
+        return Task.from_row(
+            id=self.id,
+            submission_time=self.submission_time,
+            duration=self.duration,
+            cpu_count=self.cpu_count,
+            cpu_capacity=self.cpu_capacity,
+            mem_capacity=self.mem_capacity,
+            fragments=[f.to_pydantic() for f in self.fragments],
+        )
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get duration in seconds (convenience property)."""
+        return self.duration / 1000.0
+
+    @property
+    def total_cpu_mhz(self) -> float:
+        """Get total CPU capacity in MHz."""
+        return self.cpu_count * self.cpu_capacity
+
+    @property
+    def mem_capacity_gb(self) -> float:
+        """Get memory capacity in GB (convenience property)."""
+        return self.mem_capacity / 1024.0
+
+    @property
+    def fragment_count(self) -> int:
+        """Get number of fragments."""
+        return len(self.fragments)
@@ -10,9 +10,10 @@ This module defines the hierarchical structure of a datacenter:
 """
 
 from datetime import datetime
-from typing import Annotated, Literal
+from functools import cached_property
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Discriminator, Field, Tag
+from pydantic import BaseModel, Discriminator, Field, Tag, field_serializer
 
 
 class CPU(BaseModel):
@@ -72,10 +73,25 @@ class MseCPUPowerModel(BaseModel):
     )
 
 
-# Union of all CPU power model types
+def _power_model_tag(value: Any) -> str | None:
+    """Return the union tag for a CPU power model (dict input or model instance).
+
+    Payloads without ``modelType`` keep their previous resolution: MSE if they carry
+    a ``calibrationFactor``, asymptotic otherwise.
+    """
+    if isinstance(value, dict):
+        tag = value.get("modelType")
+        if tag is None:
+            return "mse" if "calibrationFactor" in value else "asymptotic"
+        return tag
+    return getattr(value, "modelType", None)
+
+
+# Union of all CPU power model types, dispatched on modelType (one tag lookup
+# instead of trying each member in turn)
 CPUPowerModel = Annotated[
     Annotated[AsymptoticCPUPowerModel, Tag("asymptotic")] | Annotated[MseCPUPowerModel, Tag("mse")],
-    Discriminator("modelType"),
+    Discriminator(_power_model_tag),
 ]
 
 
@@ -86,9 +102,7 @@ class Host(BaseModel):
     count: int = Field(..., description="Number of identical hosts", gt=0)
     cpu: CPU = Field(..., description="CPU specification")
     memory: Memory = Field(..., description="Memory specification")
-    cpuPowerModel: AsymptoticCPUPowerModel | MseCPUPowerModel = Field(
-        ..., description="CPU power consumption model"
-    )
+    cpuPowerModel: CPUPowerModel = Field(..., description="CPU power consumption model")
 
 
 class PowerSource(BaseModel):
@@ -118,23 +132,45 @@ class Topology(BaseModel):
         ..., description="List of clusters in the datacenter", min_length=1
     )
 
+    @cached_property
+    def _totals(self) -> tuple[int, int, int]:
+        """Host, core and memory totals, computed in one pass and memoized.
+
+        Topologies are treated as immutable once built: derive variants with
+        ``model_copy()``/``copy.deepcopy()`` (which drop the memoized value)
+        rather than mutating the hosts of a topology whose totals were read.
+        """
+        hosts = cores = memory = 0
+        for cluster in self.clusters:
+            for host in cluster.hosts:
+                hosts += host.count
+                cores += host.count * host.cpu.coreCount
+                memory += host.count * host.memory.memorySize
+        return hosts, cores, memory
+
     def total_host_count(self) -> int:
         """Calculate total number of physical hosts across all clusters."""
-        return sum(host.count for cluster in self.clusters for host in cluster.hosts)
+        return self._totals[0]
 
     def total_core_count(self) -> int:
         """Calculate total number of CPU cores across all clusters."""
-        return sum(
-            host.count * host.cpu.coreCount for cluster in self.clusters for host in cluster.hosts
-        )
+        return self._totals[1]
 
     def total_memory_bytes(self) -> int:
         """Calculate total memory capacity in bytes across all clusters."""
-        return sum(
-            host.count * host.memory.memorySize
-            for cluster in self.clusters
-            for host in cluster.hosts
-        )
+        return self._totals[2]
+
+    def model_copy(self, *, update=None, deep: bool = False) -> "Topology":
+        """Copy the topology without its memoized totals (the copy may be modified)."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_totals", None)
+        return copied
+
+    def __deepcopy__(self, memo=None) -> "Topology":
+        """Deep-copy the topology without its memoized totals."""
+        copied = super().__deepcopy__(memo)
+        copied.__dict__.pop("_totals", None)
+        return copied
 
     class Config:
         # Allow extra fields for forward compatibility
@@ -152,9 +188,7 @@ class TopologySnapshot(BaseModel):
     )
     topology: Topology = Field(..., description="The datacenter topology")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.strftime("%Y-%m-%dT%H:%M:%S")
-            if v.microsecond == 0
-            else v.isoformat()
-        }
+    @field_serializer("timestamp", when_used="json")
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601 (isoformat omits zero microseconds)."""
+        return v.isoformat()
@@ -0,0 +1,38 @@
+"""Shared annotated field types for the workload models."""
+
+from datetime import UTC, datetime
+from typing import Annotated
+
+from pydantic import BeforeValidator
+
+
+def parse_utc_timestamp(v: datetime | int | float | str) -> datetime:
+    """Parse a timestamp from epoch milliseconds, ISO string or datetime (UTC-aware).
+
+    Args:
+        v: Timestamp as milliseconds (int/float), datetime object, or ISO string
+
+    Returns:
+        UTC-aware datetime object
+    """
+    if isinstance(v, (int, float)):
+        # Convert milliseconds to seconds for datetime, make it UTC-aware
+        return datetime.fromtimestamp(v / 1000.0, tz=UTC)
+    elif isinstance(v, str):
+        # Parse ISO format string (Python 3.11+ accepts a trailing "Z" directly)
+        dt = datetime.fromisoformat(v)
+        # Ensure UTC if not already timezone-aware
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        return dt
+    elif isinstance(v, datetime):
+        # If already datetime but naive, make it UTC
+        if v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+        return v
+    return v
+
+
+# Plain function validator: pydantic-core calls it directly, without the
+# classmethod/field_validator indirection
+UtcDatetime = Annotated[datetime, BeforeValidator(parse_utc_timestamp)]
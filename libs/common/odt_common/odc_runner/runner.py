@@ -2,22 +2,56 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import shutil
 import subprocess
+import tempfile
+from collections.abc import Sequence
 from datetime import UTC, datetime
+from functools import cached_property
 from pathlib import Path
 
 import pyarrow as pa
 import pyarrow.parquet as pq
+from pydantic_core import to_json
 
-from odt_common.models import Task, Topology
+from odt_common.models import Task, TaskRecord, Topology
+from odt_common.task_accumulator import TaskSnapshot
 
 from .java_home import detect_java_home
 
 logger = logging.getLogger(__name__)
 
+# JVM options picked up by the OpenDC launcher script. Every simulation starts a fresh
+# JVM, so the class-data-sharing archive (created on the first run, JDK 19+) lets later
+# runs map the already-parsed OpenDC/Kotlin classes instead of loading them again.
+OPENDC_JVM_OPTS_VAR = "OPEN_DC_EXPERIMENT_RUNNER_OPTS"
+CDS_ARCHIVE = Path(tempfile.gettempdir()) / "opendc-experiment-runner.jsa"
+
+WORKLOAD_FILES = ("tasks.parquet", "fragments.parquet")
+
+# Explicit workload schemas (OpenDC requires non-nullable columns). Empty workloads use
+# the same schemas, written as zero-row files.
+TASKS_SCHEMA = pa.schema(
+    [
+        ("id", pa.int32(), False),  # required (not nullable)
+        ("submission_time", pa.int64(), False),
+        ("duration", pa.int64(), False),
+        ("cpu_count", pa.int32(), False),
+        ("cpu_capacity", pa.float64(), False),
+        ("mem_capacity", pa.int64(), False),
+    ]
+)
+FRAGMENTS_SCHEMA = pa.schema(
+    [
+        ("id", pa.int32(), False),  # required (not nullable)
+        ("duration", pa.int64(), False),
+        ("cpu_count", pa.int32(), False),
+        ("cpu_usage", pa.float64(), False),
+    ]
+)
+
 
 class OpenDCRunner:
     """Wrapper around OpenDC ExperimentRunner binary.
@@ -43,6 +77,12 @@ class OpenDCRunner:
 
         self.opendc_path = opendc_bin_path
 
+        # Last serialized topology, reused while the same Topology object is simulated
+        self._topology_cache: tuple[Topology, bytes] | None = None
+
+        # Workload key and directory of the last generated tasks/fragments parquet files
+        self._workload_cache: tuple[tuple[int, int, int], Path] | None = None
+
         # Verify the binary exists
         if not self.opendc_path.exists():
             raise FileNotFoundError(
@@ -62,98 +102,166 @@ class OpenDCRunner:
 
         logger.info(f"✅ OpenDC runner initialized: {self.opendc_path}")
 
-    def _create_tasks_parquet(self, tasks: list[Task], output_path: Path) -> None:
-        """Create tasks.parquet file from Task models."""
-        if not tasks:
-            logger.warning("No tasks provided, creating empty tasks.parquet")
-            schema = pa.schema(
-                [
-                    ("id", pa.int64()),
-                    ("submission_time", pa.int64()),
-                    ("duration", pa.int64()),
-                    ("cpu_count", pa.int32()),
-                    ("cpu_capacity", pa.float64()),
-                    ("mem_capacity", pa.int64()),
-                ]
-            )
-            table = pa.Table.from_pydict({}, schema=schema)
-            pq.write_table(table, output_path)
-            return
+    @staticmethod
+    def _write_parquet(table: pa.Table, output_path: Path) -> None:
+        """Write an OpenDC input table to Parquet.
+
+        Dictionary encoding is disabled: task IDs are unique and the other columns are
+        mostly numeric, so building dictionaries costs ~3x the write time for no
+        meaningful size reduction.
+        """
+        pq.write_table(table, output_path, compression="snappy", use_dictionary=False)
 
-        # Create explicit schema (OpenDC requires non-nullable columns)
-        schema = pa.schema(
+    @staticmethod
+    def _build_workload_columns(
+        tasks: Sequence[Task] | Sequence[TaskRecord],
+    ) -> tuple[list, list]:
+        """Extract the tasks and fragments parquet columns in one traversal.
+
+        Args:
+            tasks: List of Task models (with fragments)
+
+        Returns:
+            Tuple of (task columns, fragment columns), each in parquet schema order.
+        """
+        # Sizes are known up front: preallocate every column and fill by index
+        # (no list growth/reallocation while appending)
+        task_count = len(tasks)
+        fragment_count = sum(len(t.fragments) for t in tasks)
+        ids, submission_times, durations, cpu_counts, cpu_capacities, mem_capacities = (
+            [None] * task_count for _ in range(6)
+        )
+        fragment_ids, fragment_durations, fragment_cpu_counts, fragment_cpu_usages = (
+            [None] * fragment_count for _ in range(4)
+        )
+        j = 0
+        for i, t in enumerate(tasks):
+            ids[i] = t.id
+            submission_times[i] = t.submission_time
+            durations[i] = t.duration
+            cpu_counts[i] = t.cpu_count
+            cpu_capacities[i] = t.cpu_capacity
+            mem_capacities[i] = t.mem_capacity
+            for f in t.fragments:
+                fragment_ids[j] = f.task_id
+                fragment_durations[j] = f.duration
+                fragment_cpu_counts[j] = f.cpu_count
+                fragment_cpu_usages[j] = f.cpu_usage
+                j += 1
+
+        # Submission times (UTC-aware) are converted to epoch milliseconds by Arrow in
+        # one C-level pass: exact integer math, no per-row float timestamp() call
+        submission_ms = pa.array(submission_times, type=pa.timestamp("ms", tz="UTC")).cast(
+            pa.int64()
+        )
+
+        task_columns = [
+            ids,
+            submission_ms,
+            durations,
+            cpu_counts,
+            cpu_capacities,
+            mem_capacities,
+        ]
+        fragment_columns = [
+            fragment_ids,
+            fragment_durations,
+            fragment_cpu_counts,
+            fragment_cpu_usages,
+        ]
+        return task_columns, fragment_columns
+
+    @classmethod
+    def _write_columns(cls, columns: list, schema: pa.Schema, output_path: Path) -> None:
+        """Write columns (Python lists or Arrow arrays) as a Parquet file."""
+        table = pa.Table.from_arrays(
             [
-                ("id", pa.int32(), False),  # required (not nullable)
-                ("submission_time", pa.int64(), False),
-                ("duration", pa.int64(), False),
-                ("cpu_count", pa.int32(), False),
-                ("cpu_capacity", pa.float64(), False),
-                ("mem_capacity", pa.int64(), False),
-            ]
+                (
+                    column.cast(field.type)
+                    if isinstance(column, pa.Array)
+                    else pa.array(column, type=field.type)
+                )
+                for column, field in zip(columns, schema, strict=True)
+            ],
+            schema=schema,
         )
+        cls._write_parquet(table, output_path)
 
-        data = {
-            "id": [t.id for t in tasks],
-            "submission_time": [int(t.submission_time.timestamp() * 1000) for t in tasks],
-            "duration": [t.duration for t in tasks],
-            "cpu_count": [t.cpu_count for t in tasks],
-            "cpu_capacity": [t.cpu_capacity for t in tasks],
-            "mem_capacity": [t.mem_capacity for t in tasks],
-        }
+    def _create_workload_parquet(
+        self, tasks: Sequence[Task] | Sequence[TaskRecord], workload_dir: Path
+    ) -> None:
+        """Create tasks.parquet and fragments.parquet from a single pass over the tasks.
 
-        table = pa.Table.from_pydict(data, schema=schema)
-        pq.write_table(table, output_path)
-        logger.debug(f"Created tasks.parquet with {len(tasks)} tasks")
+        Tasks are accumulated append-only, so a workload with the same length and
+        boundary task IDs as the previous run is the same workload: its files are
+        copied from the previous run instead of being rebuilt.
+        """
+        key = (len(tasks), tasks[0].id, tasks[-1].id) if tasks else None
+        if key is not None and self._workload_cache is not None:
+            cached_key, cached_dir = self._workload_cache
+            if cached_key == key and self._copy_workload(cached_dir, workload_dir):
+                logger.debug("Reused workload files from %s", cached_dir)
+                return
+
+        # Accumulator snapshots carry the columns already; plain task lists are walked
+        columns = tasks.workload_columns() if isinstance(tasks, TaskSnapshot) else None
+        if columns is None:
+            columns = self._build_workload_columns(tasks)
+        task_columns, fragment_columns = columns
+        self._create_tasks_parquet(task_columns, workload_dir / "tasks.parquet")
+        self._create_fragments_parquet(fragment_columns, workload_dir / "fragments.parquet")
+        self._workload_cache = (key, workload_dir) if key is not None else None
+
+    @staticmethod
+    def _copy_workload(source_dir: Path, workload_dir: Path) -> bool:
+        """Copy previously generated workload files into a new workload directory.
 
-    def _create_fragments_parquet(self, tasks: list[Task], output_path: Path) -> None:
-        """Create fragments.parquet file from Task models."""
-        all_fragments = []
-        for task in tasks:
-            all_fragments.extend(task.fragments)
+        Args:
+            source_dir: Workload directory of an earlier run
+            workload_dir: Workload directory to populate
 
-        if not all_fragments:
-            logger.warning("No fragments provided, creating empty fragments.parquet")
-            schema = pa.schema(
-                [
-                    ("id", pa.int64()),
-                    ("duration", pa.int64()),
-                    ("cpu_count", pa.int32()),
-                    ("cpu_usage", pa.float64()),
-                ]
-            )
-            table = pa.Table.from_pydict({}, schema=schema)
-            pq.write_table(table, output_path)
-            return
+        Returns:
+            True if the files were copied (or already in place), False if they must be rebuilt
+        """
+        if source_dir == workload_dir:
+            return all((workload_dir / name).exists() for name in WORKLOAD_FILES)
 
-        # Create explicit schema (OpenDC requires non-nullable columns)
-        schema = pa.schema(
-            [
-                ("id", pa.int32(), False),  # required (not nullable)
-                ("duration", pa.int64(), False),
-                ("cpu_count", pa.int32(), False),
-                ("cpu_usage", pa.float64(), False),
-            ]
-        )
+        try:
+            for name in WORKLOAD_FILES:
+                shutil.copyfile(source_dir / name, workload_dir / name)
+        except OSError as e:
+            logger.debug("Cannot reuse workload files from %s: %s", source_dir, e)
+            return False
+        return True
+
+    def _create_tasks_parquet(self, columns: list, output_path: Path) -> None:
+        """Create tasks.parquet file from task columns."""
+        if len(columns[0]) == 0:
+            logger.warning("No tasks provided, creating empty tasks.parquet")
 
-        data = {
-            "id": [f.task_id for f in all_fragments],
-            "duration": [f.duration for f in all_fragments],
-            "cpu_count": [f.cpu_count for f in all_fragments],
-            "cpu_usage": [f.cpu_usage for f in all_fragments],
-        }
+        self._write_columns(columns, TASKS_SCHEMA, output_path)
+        logger.debug("Created tasks.parquet with %d tasks", len(columns[0]))
 
-        table = pa.Table.from_pydict(data, schema=schema)
-        pq.write_table(table, output_path)
-        logger.debug(f"Created fragments.parquet with {len(all_fragments)} fragments")
+    def _create_fragments_parquet(self, columns: list, output_path: Path) -> None:
+        """Create fragments.parquet file from fragment columns."""
+        if len(columns[0]) == 0:
+            logger.warning("No fragments provided, creating empty fragments.parquet")
+
+        self._write_columns(columns, FRAGMENTS_SCHEMA, output_path)
+        logger.debug("Created fragments.parquet with %d fragments", len(columns[0]))
 
     def _create_topology_json(self, topology: Topology, output_path: Path) -> None:
-        """Create topology.json file from Topology model."""
-        topology_dict = topology.model_dump(mode="json")
+        """Create topology.json file from Topology model.
+
+        The topology usually stays the same object across many runs, so its JSON is
+        serialized once and reused until a different topology is passed in.
+        """
+        if self._topology_cache is None or self._topology_cache[0] is not topology:
+            self._topology_cache = (topology, topology.model_dump_json(indent=2).encode())
 
-        with open(output_path, "w") as f:
-            json.dump(topology_dict, f, indent=2)
+        output_path.write_bytes(self._topology_cache[1])
 
-        logger.debug(f"Created topology.json at {output_path}")
+        logger.debug("Created topology.json at %s", output_path)
 
     def _create_experiment_json(
         self,
@@ -177,14 +285,15 @@ class OpenDCRunner:
             ],
         }
 
-        with open(output_path, "w") as f:
-            json.dump(experiment, f, indent=2)
+        output_path.write_bytes(to_json(experiment, indent=2))
 
-        logger.debug(f"Created experiment.json at {output_path} (output: {opendc_output_folder})")
+        logger.debug(
+            "Created experiment.json at %s (output: %s)", output_path, opendc_output_folder
+        )
 
     def run_simulation(
         self,
-        tasks: list[Task],
+        tasks: Sequence[Task] | Sequence[TaskRecord],
         topology: Topology,
         run_dir: Path,
         run_number: int,
@@ -206,7 +315,10 @@ class OpenDCRunner:
         """
 
         logger.info(f"Starting OpenDC simulation: run_{run_number}")
-        logger.debug(f"Tasks: {len(tasks)}, Fragments: {sum(len(t.fragments) for t in tasks)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Tasks: %d, Fragments: %d", len(tasks), sum(len(t.fragments) for t in tasks)
+            )
 
         input_dir, output_dir = run_dir / "input", run_dir / "output"
         input_dir.mkdir(parents=True, exist_ok=True)
@@ -221,8 +333,7 @@ class OpenDCRunner:
 
         try:
             # Create input files
-            self._create_tasks_parquet(tasks, workload_dir / "tasks.parquet")
-            self._create_fragments_parquet(tasks, workload_dir / "fragments.parquet")
+            self._create_workload_parquet(tasks, workload_dir)
             self._create_topology_json(topology, topology_file)
 
             # Configure OpenDC to write to output directory
@@ -241,21 +352,20 @@ class OpenDCRunner:
                 logger.error(f"stderr: {result.stderr[:500] if result.stderr else '(empty)'}")
                 return False, output_dir
 
-            # Write metadata
+            # Write metadata (timestamps truncated to whole seconds by isoformat itself)
             metadata = {
                 "run_number": run_number,
-                "simulated_time": simulated_time.replace(microsecond=0).isoformat(),
+                "simulated_time": simulated_time.isoformat(timespec="seconds"),
                 "last_task_time": (
-                    tasks[-1].submission_time.replace(microsecond=0).isoformat() if tasks else None
+                    tasks[-1].submission_time.isoformat(timespec="seconds") if tasks else None
                 ),
                 "task_count": len(tasks),
                 "wall_clock_time": datetime.now(UTC)
-                .replace(microsecond=0, tzinfo=None)
-                .isoformat(),
+                .replace(tzinfo=None)
+                .isoformat(timespec="seconds"),
                 "cached": False,
             }
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
+            metadata_file.write_bytes(to_json(metadata, indent=2))
 
             logger.info(f"Simulation complete: run_{run_number}")
             return True, output_dir
@@ -264,20 +374,36 @@ class OpenDCRunner:
             logger.error(f"Error running OpenDC simulation: {e}", exc_info=True)
             return False, output_dir
 
-    def _execute_opendc(
-        self, experiment_file: Path, timeout: int
-    ) -> subprocess.CompletedProcess[str]:
-        """Execute the OpenDC binary."""
+    @cached_property
+    def _opendc_env(self) -> dict[str, str]:
+        """Environment for OpenDC processes, built on first use and reused per run.
+
+        Raises:
+            RuntimeError: If JAVA_HOME is unset and Java cannot be found
+        """
         # Set up environment with JAVA_HOME
         env = os.environ.copy()
         if "JAVA_HOME" not in env:
             env["JAVA_HOME"] = detect_java_home()
 
-        logger.debug(f"Using JAVA_HOME: {env['JAVA_HOME']}")
+        logger.debug("Using JAVA_HOME: %s", env["JAVA_HOME"])
+
+        # Reuse the JVM class-data-sharing archive across runs (unless overridden)
+        env.setdefault(
+            OPENDC_JVM_OPTS_VAR,
+            f"-XX:+AutoCreateSharedArchive -XX:SharedArchiveFile={CDS_ARCHIVE}",
+        )
+        return env
+
+    def _execute_opendc(
+        self, experiment_file: Path, timeout: int
+    ) -> subprocess.CompletedProcess[str]:
+        """Execute the OpenDC binary."""
+        env = self._opendc_env
 
         # Build command
         command = [str(self.opendc_path), "--experiment-path", str(experiment_file)]
-        logger.debug(f"Command: {' '.join(command)}")
+        logger.debug("Command: %s", " ".join(command))
 
         # Execute
         try:
@@ -292,10 +418,10 @@ class OpenDCRunner:
             logger.error(f"OpenDC timed out after {timeout}s")
             raise TimeoutError(f"OpenDC simulation timed out after {timeout}s") from e
 
-        logger.debug(f"Exit code: {result.returncode}")
+        logger.debug("Exit code: %s", result.returncode)
         if result.stdout:
-            logger.debug(f"stdout: {result.stdout}")
+            logger.debug("stdout: %s", result.stdout)
         if result.stderr:
-            logger.debug(f"stderr: {result.stderr}")
+            logger.debug("stderr: %s", result.stderr)
 
         return result
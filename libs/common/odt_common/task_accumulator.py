@@ -5,28 +5,184 @@ based on frequency intervals.
 """
 
 import logging
-from datetime import datetime, timedelta
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+from typing import overload
 
-from odt_common.models import Task
+import pyarrow as pa
+
+from odt_common.models import Task, TaskRecord
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+
+# array.array typecode -> Arrow type ("q" is always a 64-bit signed integer)
+_ARROW_TYPES = {"q": pa.int64(), "d": pa.float64()}
+
+
+def _to_arrow(column: array, length: int) -> pa.Array:
+    """Copy the first ``length`` values of a typed column into an Arrow array."""
+    # Slicing copies the values (one memcpy); the copy backs the Arrow buffer so the
+    # live column can keep growing while the array is in use
+    return pa.Array.from_buffers(
+        _ARROW_TYPES[column.typecode], length, [None, pa.py_buffer(column[:length])]
+    )
+
+
+class WorkloadColumns:
+    """Columnar (struct-of-arrays) copy of accumulated tasks and their fragments.
+
+    Filled as tasks arrive, so building the OpenDC workload files does not have to
+    walk every task object again: each column is a typed ``array.array`` (amortized
+    growth) that converts to an Arrow array with a single copy. Columns follow the
+    OpenDC tasks/fragments parquet order; submission times are epoch milliseconds.
+    """
+
+    # id, submission_time, duration, cpu_count, cpu_capacity, mem_capacity
+    TASK_TYPECODES = ("q", "q", "q", "q", "d", "q")
+    # id (task ID), duration, cpu_count, cpu_usage
+    FRAGMENT_TYPECODES = ("q", "q", "q", "d")
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.task_columns = tuple(array(code) for code in self.TASK_TYPECODES)
+        self.fragment_columns = tuple(array(code) for code in self.FRAGMENT_TYPECODES)
+        # Number of fragments accumulated up to and including each task
+        self.fragment_ends = array("q")
+
+    def append(self, task: TaskRecord) -> None:
+        """Append a task and its fragments.
+
+        Args:
+            task: Task to append
+        """
+        ids, submission_times, durations, cpu_counts, cpu_capacities, mem_capacities = (
+            self.task_columns
+        )
+        ids.append(task.id)
+        submission_times.append((task.submission_time - _EPOCH) // _MILLISECOND)
+        durations.append(task.duration)
+        cpu_counts.append(task.cpu_count)
+        cpu_capacities.append(task.cpu_capacity)
+        mem_capacities.append(task.mem_capacity)
+
+        fragment_ids, fragment_durations, fragment_cpu_counts, fragment_cpu_usages = (
+            self.fragment_columns
+        )
+        for f in task.fragments:
+            fragment_ids.append(f.task_id)
+            fragment_durations.append(f.duration)
+            fragment_cpu_counts.append(f.cpu_count)
+            fragment_cpu_usages.append(f.cpu_usage)
+        self.fragment_ends.append(len(fragment_ids))
+
+    def to_arrow(self, task_count: int) -> tuple[list[pa.Array], list[pa.Array]]:
+        """Get Arrow columns for the first ``task_count`` tasks.
+
+        Args:
+            task_count: Number of leading tasks to include
+
+        Returns:
+            Tuple of (task columns, fragment columns) as Arrow arrays
+        """
+        fragment_count = self.fragment_ends[task_count - 1] if task_count else 0
+        return (
+            [_to_arrow(column, task_count) for column in self.task_columns],
+            [_to_arrow(column, fragment_count) for column in self.fragment_columns],
+        )
+
+
+class TaskSnapshot(Sequence[TaskRecord]):
+    """Read-only view of the first ``length`` tasks of an accumulator.
+
+    The accumulator only ever appends, so a prefix of its task list never changes:
+    the snapshot shares the list instead of copying it, and tasks added afterwards
+    (e.g. by a consumer thread) are not visible through it.
+    """
+
+    __slots__ = ("_tasks", "_length", "_columns")
+
+    def __init__(
+        self,
+        tasks: list[TaskRecord],
+        length: int | None = None,
+        columns: WorkloadColumns | None = None,
+    ) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            tasks: Append-only task list to view
+            length: Number of leading tasks in the snapshot (defaults to all current tasks)
+            columns: Columnar copy of the same task list, if maintained
+        """
+        self._tasks = tasks
+        self._length = len(tasks) if length is None else length
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> TaskRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TaskRecord]: ...
+
+    def __getitem__(self, index: int | slice) -> TaskRecord | list[TaskRecord]:
+        # Indexing a range normalizes negative indices/slices and bounds-checks
+        # against the snapshot length rather than the live list
+        positions = range(self._length)[index]
+        if isinstance(positions, range):
+            return [self._tasks[i] for i in positions]
+        return self._tasks[positions]
+
+    def __iter__(self) -> Iterator[TaskRecord]:
+        return islice(self._tasks, self._length)
+
+    def __reduce__(self) -> tuple[type["TaskSnapshot"], tuple[list[TaskRecord]]]:
+        # Ship only the snapshot's tasks to other processes
+        return TaskSnapshot, (self._tasks[: self._length],)
+
+    def workload_columns(self) -> tuple[list[pa.Array], list[pa.Array]] | None:
+        """Get the snapshot's tasks and fragments as Arrow columns.
+
+        Returns:
+            Tuple of (task columns, fragment columns) in OpenDC parquet order, or None
+            if the accumulator keeps no columnar copy (e.g. after pickling)
+        """
+        if self._columns is None:
+            return None
+        return self._columns.to_arrow(self._length)
+
 
 class TaskAccumulator:
     """Accumulates tasks chronologically for simulation."""
 
     def __init__(self) -> None:
         """Initialize the task accumulator."""
-        self.tasks: list[Task] = []
+        self.tasks: list[TaskRecord] = []
+        self.columns = WorkloadColumns()
         self.last_simulation_time: datetime | None = None
         self.first_task_time: datetime | None = None
 
-    def add_task(self, task: Task) -> None:
+    def add_task(self, task: Task | TaskRecord) -> None:
         """Add a task to the accumulator.
 
+        Validated tasks are stored as slotted ``TaskRecord`` instances to keep the
+        memory footprint of long runs down, and copied into columnar form for
+        workload file generation.
+
         Args:
             task: Task to add
         """
+        if isinstance(task, Task):
+            task = TaskRecord.from_pydantic(task)
+        # Columns first: a snapshot taken concurrently only covers listed tasks
+        self.columns.append(task)
         self.tasks.append(task)
 
         # Track the first task's submission time (rounded down to whole minutes)
@@ -36,7 +192,7 @@ class TaskAccumulator:
             self.first_task_time = rounded_time
             logger.info(f"First task received at {task.submission_time}, rounded to {rounded_time}")
 
-        logger.debug(f"Added task {task.id}, total tasks: {len(self.tasks)}")
+        logger.debug("Added task %s, total tasks: %d", task.id, len(self.tasks))
 
     def should_simulate(self, heartbeat_time: datetime, frequency: timedelta) -> bool:
         """Check if simulation should be triggered.
@@ -91,13 +247,13 @@ class TaskAccumulator:
             # Subsequent simulations: last_simulation_time + frequency
             return self.last_simulation_time + frequency
 
-    def get_all_tasks(self) -> list[Task]:
+    def get_all_tasks(self) -> TaskSnapshot:
         """Get all accumulated tasks.
 
         Returns:
-            List of all tasks
+            Read-only snapshot of all tasks accumulated so far (not a copy)
         """
-        return self.tasks.copy()
+        return TaskSnapshot(self.tasks, columns=self.columns)
 
     def update_simulation_time(self, simulation_time: datetime) -> None:
         """Update the last simulation time.
@@ -1,16 +1,37 @@
 """Kafka utilities for OpenDT services."""
 
-import json
+import itertools
 import logging
 import os
 from typing import Any
 
 from kafka import KafkaConsumer, KafkaProducer
 from kafka.errors import KafkaError
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_key(key: str | None) -> bytes | None:
+    """Encode a message key as UTF-8."""
+    return key.encode("utf-8") if key else None
+
+
+def _decode_key(key: bytes | None) -> str | None:
+    """Decode a UTF-8 message key."""
+    return key.decode("utf-8") if key else None
+
+
+def _serialize_value(value: Any) -> bytes:
+    """Serialize a message payload to JSON bytes.
+
+    Pydantic models (also nested in dicts) are encoded directly by pydantic-core,
+    with the same field names and values as ``model_dump(mode="json")``.
+    """
+    return to_json(value, by_alias=False)
+
+
 def get_kafka_bootstrap_servers() -> str:
     """Get Kafka bootstrap servers from environment or use default."""
     return os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:29092")
@@ -31,8 +52,9 @@ def get_kafka_producer(bootstrap_servers: str | None = None, **kwargs: Any) -> K
 
     default_config = {
         "bootstrap_servers": bootstrap_servers,
-        "value_serializer": lambda v: json.dumps(v).encode("utf-8"),
-        "key_serializer": lambda k: k.encode("utf-8") if k else None,
+        # pydantic-core's JSON encoder: compiled, and returns UTF-8 bytes directly
+        "value_serializer": _serialize_value,
+        "key_serializer": _encode_key,
         "acks": "all",
         "retries": 3,
         "max_in_flight_requests_per_connection": 1,
@@ -71,8 +93,8 @@ def get_kafka_consumer(
     default_config = {
         "bootstrap_servers": bootstrap_servers,
         "group_id": group_id,
-        "value_deserializer": lambda m: json.loads(m.decode("utf-8")),
-        "key_deserializer": lambda k: k.decode("utf-8") if k else None,
+        "value_deserializer": from_json,
+        "key_deserializer": _decode_key,
         "auto_offset_reset": "earliest",
         "enable_auto_commit": True,
         "max_poll_records": 500,
@@ -85,37 +107,59 @@ def get_kafka_consumer(
     return KafkaConsumer(*topics, **config)
 
 
-_message_count = {"count": 0}  # Mutable counter for first-message logging
+# Delivered-message counter for first-message logging (next() is atomic, so it is
+# safe to advance from the producer's I/O thread callbacks)
+_message_counter = itertools.count(1)
+
+
+def _log_delivery(topic: str, record_metadata: Any) -> None:
+    """Log a delivered message (first few at INFO level for debugging)."""
+    message_number = next(_message_counter)
+    if message_number <= 5:
+        logger.info(
+            f"✓ Message {message_number} sent to {topic} "
+            f"partition {record_metadata.partition} offset {record_metadata.offset}"
+        )
+    else:
+        logger.debug(
+            "Message sent to %s partition %s at offset %s",
+            topic,
+            record_metadata.partition,
+            record_metadata.offset,
+        )
+
+
+def _log_delivery_error(topic: str, exc: BaseException) -> None:
+    """Log a message that could not be delivered asynchronously."""
+    logger.error(f"Failed to send message to {topic}: {exc}")
 
 
 def send_message(
-    producer: KafkaProducer, topic: str, message: dict[str, Any], key: str | None = None
+    producer: KafkaProducer,
+    topic: str,
+    message: dict[str, Any] | BaseModel,
+    key: str | None = None,
+    wait: bool = True,
 ) -> None:
     """Send a message to a Kafka topic.
 
     Args:
         producer: KafkaProducer instance
         topic: Topic name
-        message: Message payload (will be JSON serialized)
+        message: Message payload (will be JSON serialized); models may be passed
+            without ``model_dump()``
         key: Optional message key
+        wait: Block until the broker acknowledges the message. Pass False for
+            high-volume streams so sends are batched by the producer (``linger_ms``);
+            delivery is then reported from callbacks, and callers should
+            ``producer.flush()`` at logical boundaries.
     """
     try:
         future = producer.send(topic, key=key, value=message)
-        # Block for 'synchronous' sends
-        record_metadata = future.get(timeout=10)
-
-        # Log first few messages at INFO level for debugging
-        _message_count["count"] += 1
-        if _message_count["count"] <= 5:
-            logger.info(
-                f"✓ Message {_message_count['count']} sent to {topic} "
-                f"partition {record_metadata.partition} offset {record_metadata.offset}"
-            )
+        if wait:
+            _log_delivery(topic, future.get(timeout=10))
         else:
-            logger.debug(
-                f"Message sent to {topic} partition {record_metadata.partition} "
-                f"at offset {record_metadata.offset}"
-            )
+            future.add_callback(_log_delivery, topic).add_errback(_log_delivery_error, topic)
     except KafkaError as e:
         logger.error(f"Failed to send message to {topic}: {e}")
         raise
@@ -0,0 +1,158 @@
+"""Tests for configuration loading."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from odt_common.config import (
+    AppConfig,
+    CalibratorConfig,
+    DynamicConfigEvent,
+    GlobalConfig,
+    WorkloadContext,
+    WorkloadMetadata,
+    _load_yaml_cached,
+)
+
+DEFAULT_CONFIG = Path(__file__).parent.parent.parent.parent / "config" / "default.yaml"
+
+
+def test_cached_yaml_is_copied(tmp_path):
+    """Test callers cannot corrupt the cached parse by mutating the result."""
+    path = tmp_path / "workload.yaml"
+    path.write_text("name: SURF\ntimestamps:\n  consumption_offset_ms: 5\n")
+
+    first = _load_yaml_cached(path)
+    first["timestamps"]["consumption_offset_ms"] = 0
+
+    assert _load_yaml_cached(path)["timestamps"]["consumption_offset_ms"] == 5
+
+
+def test_cached_yaml_invalidated_on_change(tmp_path):
+    """Test a modified file is re-parsed."""
+    path = tmp_path / "workload.yaml"
+    path.write_text("name: SURF\n")
+    assert WorkloadMetadata.load(path).name == "SURF"
+
+    path.write_text("name: Other\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert WorkloadMetadata.load(path).name == "Other"
+
+
+def test_app_config_load_repeatable(tmp_path):
+    """Test repeated loads of the same config file yield independent equal configs."""
+    path = tmp_path / "config.yaml"
+    shutil.copy(DEFAULT_CONFIG, path)
+
+    first = AppConfig.load(path)
+    second = AppConfig.load(path)
+
+    assert first == second
+    assert first is not second
+
+
+def test_apply_to_config_updates_only_target_branch():
+    """Test a dynamic update copies the changed branch and shares the rest."""
+    config = AppConfig.load(DEFAULT_CONFIG)
+    event = DynamicConfigEvent(setting_key="global_config.speed_factor", new_value=5)
+
+    updated = event.apply_to_config(config)
+
+    assert updated.global_config.speed_factor == 5.0
+    assert config.global_config.speed_factor != 5.0
+    assert updated.services is config.services
+
+
+def test_apply_to_config_validates():
+    """Test field and cross-model validators still run on dynamic updates."""
+    config = AppConfig.load(DEFAULT_CONFIG)
+
+    with pytest.raises(ValueError):
+        DynamicConfigEvent(setting_key="global_config.speed_factor", new_value=0).apply_to_config(
+            config
+        )
+    with pytest.raises(ValueError, match="Invalid setting key"):
+        DynamicConfigEvent(setting_key="global_config.missing", new_value=1).apply_to_config(config)
+
+
+def test_workload_context_paths_resolved_once(tmp_path):
+    """Test workload paths are resolved once and reused."""
+    context = WorkloadContext(workload_dir=tmp_path)
+
+    assert context.tasks_file == tmp_path / "tasks.parquet"
+    assert context.tasks_file is context.tasks_file
+    assert context.get_file_status() == {
+        "tasks": False,
+        "fragments": False,
+        "consumption": False,
+        "topology": False,
+    }
+
+
+def test_workload_context_file_status(tmp_path):
+    """Test file status reflects which workload files are present."""
+    (tmp_path / "tasks.parquet").touch()
+    (tmp_path / "topology.json").touch()
+
+    assert WorkloadContext(workload_dir=tmp_path).get_file_status() == {
+        "tasks": True,
+        "fragments": False,
+        "consumption": False,
+        "topology": True,
+    }
+    assert not any(WorkloadContext(workload_dir=tmp_path / "missing").get_file_status().values())
+
+
+def test_leaf_configs_frozen():
+    """Test leaf configs reject mutation and unknown keys."""
+    config = AppConfig.load(DEFAULT_CONFIG)
+
+    with pytest.raises(ValidationError):
+        config.global_config.speed_factor = 2.0
+    with pytest.raises(ValidationError):
+        GlobalConfig(speed_factor=2.0, speed_factr=3.0)
+
+
+def test_calibrator_legacy_fields_mapped():
+    """Test legacy asym_util_* keys still populate the new calibrator fields."""
+    calibrator = CalibratorConfig(asym_util_min=0.2, asym_util_max=0.8, asym_util_points=4)
+
+    assert (calibrator.min_value, calibrator.max_value, calibrator.linspace_points) == (
+        0.2,
+        0.8,
+        4,
+    )
+
+
+def test_workload_metadata_missing_file(tmp_path):
+    """Test a missing workload.yaml yields default metadata named after the directory."""
+    metadata = WorkloadMetadata.load(tmp_path / "workload.yaml")
+
+    assert metadata.name == tmp_path.name
+    assert metadata.consumption_offset_ms == 0
+
+
+def test_workload_context_metadata_loaded_lazily(tmp_path, monkeypatch):
+    """Test workload.yaml is only read when the consumption offset is needed."""
+    (tmp_path / "workload.yaml").write_text("name: SURF\ntimestamps:\n  consumption_offset_ms: 5\n")
+    loads = []
+    load = WorkloadMetadata.load
+
+    def recording_load(path):
+        loads.append(path)
+        return load(path)
+
+    monkeypatch.setattr(WorkloadMetadata, "load", recording_load)
+
+    context = WorkloadContext(workload_dir=tmp_path)
+    assert loads == []
+
+    assert context.consumption_offset_ms == 5
+    assert context.consumption_offset_ms == 5
+    assert loads == [tmp_path / "workload.yaml"]
+    assert WorkloadContext(workload_dir=tmp_path / "missing").consumption_offset_ms == 0
@@ -0,0 +1,128 @@
+"""Tests for Kafka helpers."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from kafka.errors import KafkaTimeoutError
+from kafka.future import Future
+from pydantic_core import from_json
+
+from odt_common.models import Fragment, Task, Topology, TopologySnapshot
+from odt_common.utils import get_kafka_consumer, get_kafka_producer, send_message
+from odt_common.utils import kafka as kafka_utils
+
+
+class FakeFuture(Future):
+    """Future with the blocking ``get`` of kafka's FutureRecordMetadata."""
+
+    def get(self, timeout: float | None = None):
+        if self.failed():
+            raise self.exception
+        return self.value
+
+
+class FakeProducer:
+    """Producer stub recording sends and handing out unresolved futures."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, str | None, dict]] = []
+        self.futures: list[FakeFuture] = []
+
+    def send(self, topic: str, key: str | None = None, value: dict | None = None) -> FakeFuture:
+        self.sent.append((topic, key, value))
+        future = FakeFuture()
+        self.futures.append(future)
+        return future
+
+
+def test_send_message_without_wait_does_not_block(caplog):
+    """Test asynchronous sends return before delivery and log failures later."""
+    producer = FakeProducer()
+
+    send_message(producer, "dc.workload", {"message_type": "heartbeat"}, wait=False)
+
+    assert producer.sent == [("dc.workload", None, {"message_type": "heartbeat"})]
+    producer.futures[0].failure(KafkaTimeoutError("broker unavailable"))  # logged, not raised
+    assert "Failed to send message to dc.workload" in caplog.text
+
+
+def test_send_message_waits_by_default():
+    """Test synchronous sends surface delivery errors to the caller."""
+    failed = FakeFuture()
+    failed.failure(KafkaTimeoutError("broker unavailable"))
+    producer = FakeProducer()
+    producer.send = lambda topic, key=None, value=None: failed
+
+    with pytest.raises(KafkaTimeoutError):
+        send_message(producer, "sim.topology", {}, key="topology")
+
+
+def test_send_message_logs_delivery(caplog):
+    """Test delivery callbacks receive the record metadata."""
+    producer = FakeProducer()
+
+    with caplog.at_level("DEBUG", logger="odt_common.utils.kafka"):
+        send_message(producer, "dc.power", {"power_draw": 1.0}, wait=False)
+        producer.futures[0].success(SimpleNamespace(partition=0, offset=42))
+
+    assert "offset 42" in caplog.text
+
+
+def test_default_serializers_round_trip(monkeypatch):
+    """Test the default producer/consumer codecs are inverse of each other."""
+    configs = {}
+    monkeypatch.setattr(kafka_utils, "KafkaProducer", lambda **config: configs.update(config))
+    monkeypatch.setattr(
+        kafka_utils,
+        "KafkaConsumer",
+        lambda *topics, **config: configs.update({f"consumer_{k}": v for k, v in config.items()}),
+    )
+    get_kafka_producer("localhost:9092")
+    get_kafka_consumer(["dc.workload"], "test", "localhost:9092")
+
+    message = {"message_type": "task", "task": {"id": 1, "cpu_usage": [1.5, float("inf")]}}
+    payload = configs["value_serializer"](message)
+
+    assert isinstance(payload, bytes)
+    assert configs["consumer_value_deserializer"](payload) == message
+    assert configs["consumer_key_deserializer"](configs["key_serializer"]("topology")) == "topology"
+    assert configs["key_serializer"](None) is None
+
+
+def test_models_serialized_like_model_dump():
+    """Test models passed to the producer encode exactly like their JSON dumps."""
+    task = Task(
+        id=1,
+        submission_time=datetime(2022, 10, 6, 22, 0, tzinfo=UTC),
+        duration=1000,
+        cpu_count=2,
+        cpu_capacity=2100.0,
+        mem_capacity=1024,
+        fragments=[Fragment(id=1, duration=500, cpu_count=2, cpu_usage=100.0)],
+    )
+    topology = Topology.model_validate(
+        {
+            "clusters": [
+                {
+                    "name": "C01",
+                    "hosts": [
+                        {
+                            "name": "H01",
+                            "count": 1,
+                            "cpu": {"coreCount": 16, "coreSpeed": 2100.0},
+                            "memory": {"memorySize": 1024},
+                            "cpuPowerModel": {"power": 400.0, "idlePower": 32.0, "maxPower": 180.0},
+                        }
+                    ],
+                }
+            ]
+        }
+    )
+    snapshot = TopologySnapshot(timestamp=datetime(2022, 10, 6, 22, 0, 30), topology=topology)
+
+    serialize = kafka_utils._serialize_value
+
+    assert serialize({"task": task}) == serialize({"task": task.model_dump(mode="json")})
+    assert serialize(snapshot) == serialize(snapshot.model_dump(mode="json"))
+    assert from_json(serialize(snapshot))["timestamp"] == "2022-10-06T22:00:30"
@@ -1,12 +1,16 @@
 """Tests for Pydantic models with actual SURF workload data."""
 
-from datetime import datetime
+import dataclasses
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 import pytest
+from pydantic import ValidationError
 
-from odt_common import Consumption, Fragment, Task
+from odt_common import Consumption, Fragment, FragmentRecord, Task, TaskRecord
+from odt_common.models.columns import drop_invalid_rows
 
 # Locate test data
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "workload" / "SURF"
@@ -57,9 +61,9 @@ class TestTaskModel:
     def test_parse_all_tasks(self, tasks_df):
         """Test parsing all tasks."""
         errors = []
-        for idx, row in tasks_df.iterrows():
+        for idx, row in enumerate(tasks_df.to_dict("records")):
             try:
-                Task(**row.to_dict())
+                Task(**row)
             except Exception as e:
                 errors.append(f"Row {idx}: {e}")
 
@@ -89,9 +93,7 @@ class TestTaskModel:
 
         if first_task_id in fragments_by_task.groups:
             task_fragments = fragments_by_task.get_group(first_task_id)
-            task_dict["fragments"] = [
-                Fragment(**row.to_dict()) for _, row in task_fragments.iterrows()
-            ]
+            task_dict["fragments"] = [Fragment(**row) for row in task_fragments.to_dict("records")]
 
         task = Task(**task_dict)
         assert isinstance(task.fragments, list)
@@ -114,9 +116,9 @@ class TestFragmentModel:
     def test_parse_all_fragments(self, fragments_df):
         """Test parsing all fragments."""
         errors = []
-        for idx, row in fragments_df.iterrows():
+        for idx, row in enumerate(fragments_df.to_dict("records")):
             try:
-                Fragment(**row.to_dict())
+                Fragment(**row)
             except Exception as e:
                 errors.append(f"Row {idx}: {e}")
 
@@ -138,6 +140,14 @@ class TestFragmentModel:
         assert fragment.duration_seconds == fragment.duration / 1000.0
         assert fragment.total_cpu_usage_mhz == fragment.cpu_count * fragment.cpu_usage
 
+    def test_fragment_frozen(self):
+        """Test fragments reject mutation and can be deduplicated in sets."""
+        fragment = Fragment(id=1, duration=1000, cpu_count=2, cpu_usage=100.0)
+
+        with pytest.raises(ValidationError):
+            fragment.duration = 0
+        assert len({fragment, Fragment.from_row(1, 1000, 2, 100.0)}) == 1
+
 
 class TestConsumptionModel:
     """Test Consumption Pydantic model."""
@@ -154,9 +164,9 @@ class TestConsumptionModel:
     def test_parse_all_consumption(self, consumption_df):
         """Test parsing all consumption records."""
         errors = []
-        for idx, row in consumption_df.iterrows():
+        for idx, row in enumerate(consumption_df.to_dict("records")):
             try:
-                Consumption(**row.to_dict())
+                Consumption(**row)
             except Exception as e:
                 errors.append(f"Row {idx}: {e}")
 
@@ -170,6 +180,143 @@ class TestConsumptionModel:
         assert consumption.energy_usage_kwh == consumption.energy_usage / 3_600_000.0
 
 
+class TestTrustedConstruction:
+    """Test unvalidated construction from pre-coerced parquet rows."""
+
+    def test_task_from_row_matches_validated(self, tasks_df):
+        """Test from_row produces the same task as the validating constructor."""
+        task_dict = tasks_df.iloc[0].to_dict()
+        validated = Task(**task_dict)
+
+        task = Task.from_row(
+            id=validated.id,
+            submission_time=validated.submission_time,
+            duration=validated.duration,
+            cpu_count=validated.cpu_count,
+            cpu_capacity=validated.cpu_capacity,
+            mem_capacity=validated.mem_capacity,
+        )
+
+        assert task == validated
+        assert task.fragments == []
+
+    def test_fragment_from_row_matches_validated(self, fragments_df):
+        """Test from_row produces the same fragment as the validating constructor."""
+        validated = Fragment(**fragments_df.iloc[0].to_dict())
+
+        fragment = Fragment.from_row(
+            task_id=validated.task_id,
+            duration=validated.duration,
+            cpu_count=validated.cpu_count,
+            cpu_usage=validated.cpu_usage,
+        )
+
+        assert fragment == validated
+
+    def test_consumption_from_row_matches_validated(self, consumption_df):
+        """Test from_row produces the same record as the validating constructor."""
+        validated = Consumption(**consumption_df.iloc[0].to_dict())
+
+        consumption = Consumption.from_row(
+            power_draw=validated.power_draw,
+            energy_usage=validated.energy_usage,
+            timestamp=validated.timestamp,
+        )
+
+        assert consumption == validated
+
+    def test_tasks_from_arrow_table_match_validated(self, tasks_df):
+        """Test bulk Arrow construction matches the validating constructor."""
+        head = tasks_df.head(50)
+        table = pa.Table.from_pandas(head, preserve_index=False)
+
+        tasks = Task.from_arrow_table(table)
+
+        assert tasks == [Task(**row) for row in head.to_dict("records")]
+
+    def test_tasks_from_arrow_table_attaches_fragments(self, tasks_df, fragments_df):
+        """Test bulk Arrow construction attaches grouped fragments by task ID."""
+        task_dict = tasks_df.iloc[0].to_dict()
+        table = pa.Table.from_pandas(tasks_df.head(1), preserve_index=False)
+        fragments = [
+            Fragment(**row)
+            for row in fragments_df[fragments_df["id"] == task_dict["id"]].to_dict("records")
+        ]
+
+        (task,) = Task.from_arrow_table(table, {fragments[0].task_id: fragments})
+
+        assert task.fragments == fragments
+
+    def test_tasks_from_arrow_table_strips_id_prefix(self):
+        """Test bulk Arrow construction parses 'task-' prefixed IDs."""
+        table = pa.table(
+            {
+                "id": ["task-7", "8"],
+                "submission_time": [1_700_000_000_000, 1_700_000_060_000],
+                "duration": [1000, 2000],
+                "cpu_count": [1, 2],
+                "cpu_capacity": [100.0, 200.0],
+                "mem_capacity": [1024, 2048],
+            }
+        )
+
+        tasks = Task.from_arrow_table(table)
+
+        assert [task.id for task in tasks] == [7, 8]
+        assert tasks[0].submission_time == datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC)
+
+    def test_fragments_from_arrow_table_match_validated(self, fragments_df):
+        """Test bulk Arrow construction matches the validating constructor."""
+        head = fragments_df.head(50)
+        table = pa.Table.from_pandas(head, preserve_index=False)
+
+        fragments = Fragment.from_arrow_table(table)
+
+        assert fragments == [Fragment(**row) for row in head.to_dict("records")]
+
+    def test_consumptions_from_arrow_table_match_validated(self, consumption_df):
+        """Test bulk Arrow construction matches the validating constructor."""
+        head = consumption_df.head(50)
+        table = pa.Table.from_pandas(head, preserve_index=False)
+
+        records = Consumption.from_arrow_table(table)
+
+        assert records == [Consumption(**row) for row in head.to_dict("records")]
+
+    def test_from_arrow_table_enforces_field_bounds(self):
+        """Test column-wise checks reject values the validators would reject."""
+        table = pa.table({"id": ["1"], "duration": [-5], "cpu_count": [1], "cpu_usage": [1.0]})
+
+        with pytest.raises(ValueError, match="duration"):
+            Fragment.from_arrow_table(table)
+
+    def test_drop_invalid_rows_filters_rejected_rows(self):
+        """Test rows the validators would reject are dropped and counted."""
+        table = pa.table(
+            {
+                "id": ["task-1", "x", "2", None, "3", "4"],
+                "duration": [10, 10, -5, 10, 10, 10],
+                "cpu_count": [1, 1, 1, 1, 1, 1],
+                "cpu_usage": [1.0, 1.0, 1.0, 1.0, float("nan"), 2.0],
+            }
+        )
+
+        filtered, dropped = drop_invalid_rows(table, Fragment)
+        fragments = Fragment.from_arrow_table(filtered)
+
+        assert dropped == 4
+        assert [fragment.task_id for fragment in fragments] == [1, 4]
+
+    def test_drop_invalid_rows_keeps_valid_table(self, consumption_df):
+        """Test a fully valid table is returned unchanged."""
+        table = pa.Table.from_pandas(consumption_df.head(50), preserve_index=False)
+
+        filtered, dropped = drop_invalid_rows(table, Consumption)
+
+        assert dropped == 0
+        assert filtered is table
+
+
 class TestAggregation:
     """Test task-fragment aggregation logic."""
 
@@ -182,18 +329,16 @@ class TestAggregation:
 
     def test_full_aggregation(self, tasks_df, fragments_df):
         """Test full aggregation process."""
-        fragments_by_task = fragments_df.groupby("id")
+        # Row positions per task ID; avoids slicing a sub-DataFrame per task
+        rows_by_task = fragments_df.groupby("id", sort=False).indices
+        fragment_rows = fragments_df.to_dict("records")
 
         tasks = []
-        for _, task_row in tasks_df.iterrows():
-            task_dict = task_row.to_dict()
-            task_id = task_dict["id"]
+        for task_dict in tasks_df.to_dict("records"):
+            positions = rows_by_task.get(task_dict["id"])
 
-            if task_id in fragments_by_task.groups:
-                task_fragments = fragments_by_task.get_group(task_id)
-                task_dict["fragments"] = [
-                    Fragment(**row.to_dict()) for _, row in task_fragments.iterrows()
-                ]
+            if positions is not None:
+                task_dict["fragments"] = [Fragment(**fragment_rows[i]) for i in positions]
 
             tasks.append(Task(**task_dict))
 
@@ -232,3 +377,57 @@ class TestSerializationDeserialization:
 
         assert isinstance(json_str, str)
         assert isinstance(cons_dict, dict)
+
+
+class TestRecords:
+    """Test slotted in-memory records bridged from the Pydantic models."""
+
+    def test_task_record_round_trip(self, tasks_df, fragments_df):
+        """Test TaskRecord preserves all fields and fragments through the bridge."""
+        task_dict = tasks_df.iloc[0].to_dict()
+        task_dict["fragments"] = [
+            Fragment(**row)
+            for row in fragments_df[fragments_df["id"] == task_dict["id"]]
+            .head(5)
+            .to_dict("records")
+        ]
+        task = Task(**task_dict)
+
+        record = TaskRecord.from_pydantic(task)
+
+        assert record.id == task.id
+        assert record.submission_time == task.submission_time
+        assert record.fragment_count == task.fragment_count
+        assert record.total_cpu_mhz == task.total_cpu_mhz
+        assert record.to_pydantic() == task
+
+    def test_records_are_slotted_and_frozen(self, fragments_df):
+        """Test records carry no instance dict and reject mutation."""
+        record = FragmentRecord.from_pydantic(Fragment(**fragments_df.iloc[0].to_dict()))
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.duration = 0
+
+
+class TestTimestampParsing:
+    """Test timestamp coercion in the model validators."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            1665093630000,
+            "2022-10-06T22:00:30Z",
+            "2022-10-06T22:00:30+00:00",
+            "2022-10-06T22:00:30",
+            datetime(2022, 10, 6, 22, 0, 30),
+        ],
+    )
+    def test_equivalent_inputs_parse_to_same_utc_datetime(self, value):
+        """Test epoch ms, ISO strings (with/without zone) and datetimes agree."""
+        expected = datetime(2022, 10, 6, 22, 0, 30, tzinfo=UTC)
+
+        consumption = Consumption(power_draw=1.0, energy_usage=1.0, timestamp=value)
+
+        assert consumption.timestamp == expected
+        assert consumption.timestamp.utcoffset().total_seconds() == 0
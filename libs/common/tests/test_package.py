@@ -0,0 +1,12 @@
+"""Tests for the odt_common package exports."""
+
+import odt_common
+
+
+def test_all_exports_resolve():
+    """Test every name in __all__ is lazily exported and importable."""
+    assert set(odt_common.__all__) == set(odt_common._LAZY_EXPORTS)
+    assert len(odt_common.__all__) == len(set(odt_common.__all__))
+
+    for name in odt_common.__all__:
+        assert getattr(odt_common, name) is not None
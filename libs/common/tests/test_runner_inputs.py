@@ -0,0 +1,190 @@
+"""Tests for the OpenDC runner's input file generation."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pyarrow.parquet as pq
+import pytest
+
+from odt_common.models import Fragment, Task, TaskRecord, Topology
+from odt_common.odc_runner.runner import (
+    CDS_ARCHIVE,
+    FRAGMENTS_SCHEMA,
+    OPENDC_JVM_OPTS_VAR,
+    TASKS_SCHEMA,
+    OpenDCRunner,
+)
+from odt_common.task_accumulator import TaskAccumulator
+
+BASE_TIME = datetime(2022, 10, 6, 22, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def runner(tmp_path) -> OpenDCRunner:
+    """Runner instance for input generation only (placeholder OpenDC binary)."""
+    binary = tmp_path / "OpenDCExperimentRunner"
+    binary.touch(mode=0o755)
+    return OpenDCRunner(binary)
+
+
+@pytest.fixture
+def tasks() -> list[TaskRecord]:
+    """Small accumulated workload with fragments."""
+    return [
+        TaskRecord.from_pydantic(
+            Task(
+                id=i,
+                submission_time=BASE_TIME + timedelta(seconds=30 * i, milliseconds=i),
+                duration=60_000 + i,
+                cpu_count=1 + i % 4,
+                cpu_capacity=2100.0,
+                mem_capacity=4096,
+                fragments=[
+                    Fragment(id=i, duration=30_000, cpu_count=1 + i % 4, cpu_usage=100.0 + j)
+                    for j in range(i % 3)
+                ],
+            )
+        )
+        for i in range(5)
+    ]
+
+
+def test_tasks_parquet(runner, tasks, tmp_path):
+    """Test tasks.parquet holds one row per task with epoch-ms submission times."""
+    runner._create_workload_parquet(tasks, tmp_path)
+
+    table = pq.read_table(tmp_path / "tasks.parquet")
+    assert table.schema.field("id").nullable is False
+    assert table.to_pylist()[1] == {
+        "id": 1,
+        "submission_time": int(BASE_TIME.timestamp() * 1000) + 30_001,
+        "duration": 60_001,
+        "cpu_count": 2,
+        "cpu_capacity": 2100.0,
+        "mem_capacity": 4096,
+    }
+    assert table.num_rows == len(tasks)
+
+
+def test_fragments_parquet(runner, tasks, tmp_path):
+    """Test fragments.parquet flattens fragments in task order."""
+    runner._create_workload_parquet(tasks, tmp_path)
+
+    table = pq.read_table(tmp_path / "fragments.parquet")
+    assert table.column("id").to_pylist() == [1, 2, 2, 4]
+    assert table.column("cpu_usage").to_pylist() == [100.0, 100.0, 101.0, 100.0]
+
+
+def test_empty_workload(runner, tmp_path):
+    """Test an empty workload yields zero-row files with the OpenDC schemas."""
+    runner._create_workload_parquet([], tmp_path)
+
+    tasks_table = pq.read_table(tmp_path / "tasks.parquet")
+    fragments_table = pq.read_table(tmp_path / "fragments.parquet")
+    assert tasks_table.num_rows == fragments_table.num_rows == 0
+    assert tasks_table.schema.equals(TASKS_SCHEMA)
+    assert fragments_table.schema.equals(FRAGMENTS_SCHEMA)
+
+    runner._create_workload_parquet(TaskAccumulator().get_all_tasks(), tmp_path)
+    assert pq.read_table(tmp_path / "tasks.parquet").schema.equals(TASKS_SCHEMA)
+
+
+def test_accumulator_columns_match_task_list(runner, tasks, tmp_path):
+    """Test workload files from accumulator columns equal those built from the tasks."""
+    accumulator = TaskAccumulator()
+    for task in tasks:
+        accumulator.add_task(task)
+    snapshot = accumulator.get_all_tasks()
+    accumulator.add_task(tasks[0])  # not part of the snapshot
+
+    from_list, from_columns = tmp_path / "list", tmp_path / "columns"
+    from_list.mkdir()
+    from_columns.mkdir()
+    runner._create_workload_parquet(list(snapshot), from_list)
+    runner._workload_cache = None
+    runner._create_workload_parquet(snapshot, from_columns)
+
+    for name in ("tasks.parquet", "fragments.parquet"):
+        assert pq.read_table(from_columns / name).equals(pq.read_table(from_list / name))
+
+
+def test_workload_files_reused(runner, tasks, tmp_path, monkeypatch):
+    """Test an unchanged workload is copied from the previous run, a grown one rebuilt."""
+    first, second, third = (tmp_path / f"run_{i}" for i in range(3))
+    for path in (first, second, third):
+        path.mkdir()
+    runner._create_workload_parquet(tasks, first)
+
+    build = runner._build_workload_columns
+    monkeypatch.setattr(runner, "_build_workload_columns", None)  # must not be called
+    runner._create_workload_parquet(tasks, second)
+    assert (second / "tasks.parquet").read_bytes() == (first / "tasks.parquet").read_bytes()
+
+    monkeypatch.setattr(runner, "_build_workload_columns", build)
+    runner._create_workload_parquet(tasks[:3], third)
+    assert pq.read_table(third / "tasks.parquet").num_rows == 3
+
+
+def test_topology_json_reused(runner, tmp_path):
+    """Test the topology is serialized once and re-serialized only when replaced."""
+    topology = Topology.model_validate(
+        {
+            "clusters": [
+                {
+                    "name": "C01",
+                    "hosts": [
+                        {
+                            "name": "H01",
+                            "count": 2,
+                            "cpu": {"coreCount": 16, "coreSpeed": 2100.0},
+                            "memory": {"memorySize": 1024},
+                            "cpuPowerModel": {"power": 400.0, "idlePower": 32.0, "maxPower": 180.0},
+                        }
+                    ],
+                }
+            ]
+        }
+    )
+    path = tmp_path / "topology.json"
+
+    runner._create_topology_json(topology, path)
+    cached = runner._topology_cache
+    runner._create_topology_json(topology, path)
+    assert runner._topology_cache is cached
+    assert Topology.model_validate(json.loads(path.read_text())) == topology
+
+    resized = topology.model_copy(deep=True)
+    resized.clusters[0].hosts[0].count = 4
+    runner._create_topology_json(resized, path)
+    assert json.loads(path.read_text())["clusters"][0]["hosts"][0]["count"] == 4
+
+
+def test_experiment_json(runner, tmp_path):
+    """Test experiment.json points OpenDC at the generated inputs."""
+    path = tmp_path / "experiment.json"
+    runner._create_experiment_json(
+        "run_1", tmp_path / "workload", tmp_path / "topology.json", path, str(tmp_path / "out")
+    )
+
+    experiment = json.loads(path.read_text())
+    assert experiment["name"] == "run_1"
+    assert experiment["workloads"] == [
+        {"pathToFile": str(tmp_path / "workload"), "type": "ComputeWorkload"}
+    ]
+    assert experiment["outputFolder"] == str(tmp_path / "out")
+
+
+def test_execute_reuses_class_data_archive(tmp_path, monkeypatch):
+    """Test OpenDC JVMs are started with the shared class-data archive."""
+    binary = tmp_path / "OpenDCExperimentRunner"
+    binary.write_text(f'#!/bin/sh\necho "${OPENDC_JVM_OPTS_VAR}"\n')
+    binary.chmod(0o755)
+    monkeypatch.setenv("JAVA_HOME", str(tmp_path))
+    monkeypatch.delenv(OPENDC_JVM_OPTS_VAR, raising=False)
+
+    runner = OpenDCRunner(binary)
+    result = runner._execute_opendc(tmp_path / "experiment.json", timeout=10)
+
+    assert f"-XX:SharedArchiveFile={CDS_ARCHIVE}" in result.stdout
+    assert runner._execute_opendc(tmp_path / "experiment.json", timeout=10).stdout == result.stdout
+    assert runner._opendc_env is runner._opendc_env
@@ -1,7 +1,7 @@
 """Tests for Topology models."""
 
-import json
-from datetime import datetime
+import copy
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -18,9 +18,9 @@ from odt_common.models.topology import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_topology_data() -> dict:
-    """Sample topology data matching SURF workload structure."""
+    """Sample topology data matching SURF workload structure (shared, do not mutate)."""
     return {
         "clusters": [
             {
@@ -46,6 +46,23 @@ def sample_topology_data() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def sample_topology(sample_topology_data) -> Topology:
+    """Validated sample topology, built once for the read-only tests."""
+    return Topology(**sample_topology_data)
+
+
+@pytest.fixture(scope="module")
+def surf_topology() -> Topology:
+    """SURF topology parsed and validated once per module, if the file exists."""
+    surf_topology_path = Path(__file__).parent.parent.parent.parent / "workload/SURF/topology.json"
+
+    if not surf_topology_path.exists():
+        pytest.skip("SURF topology file not found")
+
+    return Topology.model_validate_json(surf_topology_path.read_bytes())
+
+
 def test_cpu_model():
     """Test CPU model validation."""
     cpu = CPU(coreCount=16, coreSpeed=2100.0)
@@ -107,6 +124,24 @@ def test_host_model():
     assert host.memory.memorySize == 128000000
 
 
+def test_host_power_model_dispatch():
+    """Test cpuPowerModel resolves to the variant named by modelType."""
+    base = {"name": "H1", "count": 1, "cpu": {"coreCount": 8, "coreSpeed": 2000}}
+    base["memory"] = {"memorySize": 64000000}
+    power = {"power": 200, "idlePower": 20, "maxPower": 100}
+
+    mse = Host(**base, cpuPowerModel={**power, "modelType": "mse", "calibrationFactor": 2})
+    asym = Host(**base, cpuPowerModel={**power, "modelType": "asymptotic"})
+    untagged = Host(**base, cpuPowerModel=power)
+
+    assert isinstance(mse.cpuPowerModel, MseCPUPowerModel)
+    assert isinstance(asym.cpuPowerModel, AsymptoticCPUPowerModel)
+    assert isinstance(untagged.cpuPowerModel, AsymptoticCPUPowerModel)
+
+    with pytest.raises(ValueError):
+        Host(**base, cpuPowerModel={**power, "modelType": "linear"})
+
+
 def test_cluster_model():
     """Test Cluster model."""
     cluster = Cluster(
@@ -133,9 +168,9 @@ def test_cluster_model():
     assert cluster.hosts[0].name == "A01"
 
 
-def test_topology_model(sample_topology_data):
+def test_topology_model(sample_topology):
     """Test Topology model."""
-    topology = Topology(**sample_topology_data)
+    topology = sample_topology
     assert len(topology.clusters) == 1
     assert topology.clusters[0].name == "A01"
 
@@ -158,9 +193,9 @@ def test_topology_from_json(sample_topology_data):
     assert host.memory.memorySize == 128000000
 
 
-def test_topology_calculations(sample_topology_data):
+def test_topology_calculations(sample_topology):
     """Test Topology utility methods."""
-    topology = Topology(**sample_topology_data)
+    topology = sample_topology
 
     # Test calculations
     assert topology.total_host_count() == 277
@@ -168,9 +203,27 @@ def test_topology_calculations(sample_topology_data):
     assert topology.total_memory_bytes() == 277 * 128000000
 
 
-def test_topology_model_dump(sample_topology_data):
-    """Test Topology serialization."""
+def test_topology_totals_memoized(sample_topology_data):
+    """Test memoized totals stay out of equality/serialization and reset on copy."""
     topology = Topology(**sample_topology_data)
+    assert topology.total_host_count() == 277
+
+    assert topology == Topology(**sample_topology_data)
+    assert topology.model_dump() == Topology(**sample_topology_data).model_dump()
+
+    reduced = copy.deepcopy(topology)
+    reduced.clusters[0].hosts[0].count = 200
+    assert reduced.total_host_count() == 200
+
+    copied = topology.model_copy(deep=True)
+    copied.clusters[0].hosts[0].count = 100
+    assert copied.total_core_count() == 100 * 16
+    assert topology.total_host_count() == 277
+
+
+def test_topology_model_dump(sample_topology):
+    """Test Topology serialization."""
+    topology = sample_topology
 
     # Serialize back to dict
     dumped = topology.model_dump(mode="json")
@@ -181,25 +234,16 @@ def test_topology_model_dump(sample_topology_data):
     assert topology2.total_core_count() == topology.total_core_count()
 
 
-def test_topology_from_surf_file():
+def test_topology_from_surf_file(surf_topology):
     """Test loading actual SURF topology file if it exists."""
-    surf_topology_path = Path(__file__).parent.parent.parent.parent / "workload/SURF/topology.json"
-
-    if not surf_topology_path.exists():
-        pytest.skip("SURF topology file not found")
-
-    with open(surf_topology_path) as f:
-        data = json.load(f)
-
-    topology = Topology(**data)
-    assert len(topology.clusters) > 0
-    assert topology.total_host_count() > 0
-    assert topology.total_core_count() > 0
+    assert len(surf_topology.clusters) > 0
+    assert surf_topology.total_host_count() > 0
+    assert surf_topology.total_core_count() > 0
 
 
-def test_topology_snapshot(sample_topology_data):
+def test_topology_snapshot(sample_topology):
     """Test TopologySnapshot with timestamp."""
-    topology = Topology(**sample_topology_data)
+    topology = sample_topology
     timestamp = datetime(2022, 10, 7, 9, 14, 30)
 
     snapshot = TopologySnapshot(timestamp=timestamp, topology=topology)
@@ -209,9 +253,9 @@ def test_topology_snapshot(sample_topology_data):
     assert len(snapshot.topology.clusters) == 1
 
 
-def test_topology_snapshot_serialization(sample_topology_data):
+def test_topology_snapshot_serialization(sample_topology):
     """Test TopologySnapshot JSON serialization with proper timestamp format."""
-    topology = Topology(**sample_topology_data)
+    topology = sample_topology
     timestamp = datetime(2022, 10, 7, 9, 14, 30)
 
     snapshot = TopologySnapshot(timestamp=timestamp, topology=topology)
@@ -263,3 +307,10 @@ def test_topology_snapshot_with_microseconds():
     snapshot_dict = snapshot.model_dump(mode="json")
     # With microseconds, should use full ISO format
     assert "T" in snapshot_dict["timestamp"]
+    assert snapshot_dict["timestamp"] == "2022-10-07T09:14:30.123456"
+
+    # Timezone-aware timestamps keep their offset
+    aware = TopologySnapshot(
+        timestamp=datetime(2022, 10, 7, 9, 14, 30, tzinfo=UTC), topology=topology
+    )
+    assert aware.model_dump(mode="json")["timestamp"] == "2022-10-07T09:14:30+00:00"
@@ -25,18 +25,13 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 # Import from new modular structure
 from plots.config import OUTPUT_DIR
-from plots.data_loader import discover_runs
-from plots.job_completion_plot import generate_jobs_per_kwh_plot
-from plots.mape_over_time_plot import generate_mape_over_time_plot
-from plots.power_prediction_plot import generate_energy_plot
-from plots.sustainability_overview_plot import generate_efficiency_plot
 
 console = Console()
 
@@ -61,27 +56,27 @@ DEFAULT_PLOTS_EXP2 = {
 
 def select_experiment() -> int:
     """Interactively select which experiment to generate a plot for."""
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold cyan]OpenDT Reproducibility Plot Generator[/bold cyan]",
-            border_style="cyan",
-        )
-    )
-    console.print()
-
     experiments = [
         ("1", "Experiment 1: Predict power usage", "Without active calibration"),
         ("2", "Experiment 2: Predict power usage with calibration", "With active calibration"),
     ]
 
-    console.print("[bold]Select an experiment:[/bold]")
-    console.print()
-
+    # Render the banner and menu as one group (a single terminal write)
+    menu: list[RenderableType] = [
+        "",
+        Panel.fit(
+            "[bold cyan]OpenDT Reproducibility Plot Generator[/bold cyan]",
+            border_style="cyan",
+        ),
+        "",
+        "[bold]Select an experiment:[/bold]",
+        "",
+    ]
     for num, title, desc in experiments:
-        console.print(f"  [cyan]{num}[/cyan]) [bold]{title}[/bold]")
-        console.print(f"      [dim]{desc}[/dim]")
-        console.print()
+        menu.append(f"  [cyan]{num}[/cyan]) [bold]{title}[/bold]")
+        menu.append(f"      [dim]{desc}[/dim]")
+        menu.append("")
+    console.print(Group(*menu))
 
     while True:
         choice = console.input("[bold]Enter choice (1 or 2): [/bold]").strip()
@@ -142,9 +137,7 @@ def select_plots(experiment: int) -> dict[str, bool]:
 
 def select_data_source(runs: list[dict], experiment: int) -> dict | None:
     """Interactively select which data source to use."""
-    console.print()
-    console.print("[bold]Available data sources:[/bold]")
-    console.print()
+    header = ["", "[bold]Available data sources:[/bold]", ""]
 
     # Filter runs based on experiment requirements
     if experiment == 1:
@@ -165,13 +158,18 @@ def select_data_source(runs: list[dict], experiment: int) -> dict | None:
         config_file = "experiment_2.yaml"
 
     if not valid_runs:
-        console.print(f"[red]No valid runs found with {required}.[/red]")
-        console.print()
-        console.print("[dim]To generate data for this experiment, run:[/dim]")
         cmd = f"make up config=config/experiments/{config_file}"
-        console.print(f"  [cyan]{cmd}[/cyan]")
-        console.print()
-        console.print("[dim]Then wait for the simulation to complete.[/dim]")
+        console.print(
+            Group(
+                *header,
+                f"[red]No valid runs found with {required}.[/red]",
+                "",
+                "[dim]To generate data for this experiment, run:[/dim]",
+                f"  [cyan]{cmd}[/cyan]",
+                "",
+                "[dim]Then wait for the simulation to complete.[/dim]",
+            )
+        )
         return None
 
     # Build table
@@ -199,8 +197,7 @@ def select_data_source(runs: list[dict], experiment: int) -> dict | None:
             " + ".join(data_status),
         )
 
-    console.print(table)
-    console.print()
+    console.print(Group(*header, table, ""))
 
     while True:
         choice = console.input(
@@ -222,10 +219,12 @@ def select_data_source(runs: list[dict], experiment: int) -> dict | None:
 
 def select_non_calibrated_run(runs: list[dict]) -> dict | None:
     """Select a non-calibrated run for MAPE comparison (Experiment 2)."""
-    console.print()
-    console.print("[bold yellow]MAPE Over Time requires a non-calibrated run for comparison.[/bold yellow]")
-    console.print("[bold]Select a non-calibrated data source:[/bold]")
-    console.print()
+    header = [
+        "",
+        "[bold yellow]MAPE Over Time requires a non-calibrated run for comparison.[/bold yellow]",
+        "[bold]Select a non-calibrated data source:[/bold]",
+        "",
+    ]
 
     # Filter to non-calibrated runs
     valid_runs = [
@@ -233,8 +232,13 @@ def select_non_calibrated_run(runs: list[dict]) -> dict | None:
     ]
 
     if not valid_runs:
-        console.print("[red]No non-calibrated runs found.[/red]")
-        console.print("[dim]Run experiment 1 first to generate non-calibrated data.[/dim]")
+        console.print(
+            Group(
+                *header,
+                "[red]No non-calibrated runs found.[/red]",
+                "[dim]Run experiment 1 first to generate non-calibrated data.[/dim]",
+            )
+        )
         return None
 
     # Build table
@@ -254,8 +258,7 @@ def select_non_calibrated_run(runs: list[dict]) -> dict | None:
             run.get("workload", "—"),
         )
 
-    console.print(table)
-    console.print()
+    console.print(Group(*header, table, ""))
 
     while True:
         choice = console.input(
@@ -285,7 +288,10 @@ def main() -> None:
     # Select experiment
     experiment = select_experiment()
 
-    # Discover available runs
+    # Discover available runs (data_loader pulls in pandas/pyarrow, so import it
+    # only after the first prompt is answered)
+    from plots.data_loader import discover_runs
+
     runs = discover_runs()
 
     if not runs:
@@ -321,6 +327,19 @@ def main() -> None:
     workload = run.get("workload", "unknown")
     run_path = run["path"]
 
+    # Plots are only written to PDF files: select the non-interactive Agg backend
+    # before pyplot is imported so no GUI toolkit gets loaded
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    # Plot modules pull in matplotlib and set shared rcParams; import them together,
+    # only once the interactive selection is done
+    from plots.job_completion_plot import generate_jobs_per_kwh_plot
+    from plots.mape_over_time_plot import generate_mape_over_time_plot
+    from plots.power_prediction_plot import generate_energy_plot
+    from plots.sustainability_overview_plot import generate_efficiency_plot
+
     # Create experiment-specific output directory
     experiment_output_dir = OUTPUT_DIR / f"experiment_{experiment}"
     experiment_output_dir.mkdir(parents=True, exist_ok=True)
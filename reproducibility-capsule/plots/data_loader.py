@@ -7,97 +7,145 @@ Provides functions to discover experiment runs and load data from parquet files.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import yaml
 
-from .config import DATA_DIR
+from .config import DATA_DIR, METRIC_POWER
 
 if TYPE_CHECKING:
     from typing import Any
 
+# libyaml C bindings when PyYAML was built with them, pure Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def discover_runs() -> list[dict[str, Any]]:
     """Discover all available experiment runs in the data directory.
     
+    Run directories are inspected concurrently (the work is file I/O and small
+    parses); the result keeps the newest-first directory order.
+    
     Returns:
         List of run info dictionaries with paths, timestamps, and metadata.
     """
-    runs = []
-
     if not DATA_DIR.exists():
-        return runs
-
-    for run_dir in sorted(DATA_DIR.iterdir(), reverse=True):
-        if not run_dir.is_dir():
-            continue
-
-        # Check if it looks like a valid run (has config.yaml)
-        config_path = run_dir / "config.yaml"
-        metadata_path = run_dir / "metadata.json"
-
-        if not config_path.exists():
-            continue
-
-        sim_results_path = run_dir / "simulator" / "agg_results.parquet"
-        run_info: dict[str, Any] = {
-            "path": run_dir,
-            "name": run_dir.name,
-            "has_simulator": sim_results_path.exists(),
-            "has_calibrator": (run_dir / "calibrator" / "agg_results.parquet").exists(),
-            "sim_duration": "—",
-            "workload": "Unknown",
-        }
-
-        # Parse timestamp from folder name (format: YYYY_MM_DD_HH_MM_SS)
+        return []
+
+    run_dirs = sorted(DATA_DIR.iterdir(), reverse=True)
+    if not run_dirs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(run_dirs))) as executor:
+        run_infos = list(executor.map(_load_run_info, run_dirs))
+
+    return [run_info for run_info in run_infos if run_info is not None]
+
+
+def _load_run_info(run_dir: Path) -> dict[str, Any] | None:
+    """Collect run info for one run directory, or None if it is not a run."""
+    if not run_dir.is_dir():
+        return None
+
+    # Check if it looks like a valid run (has config.yaml)
+    config_path = run_dir / "config.yaml"
+    metadata_path = run_dir / "metadata.json"
+
+    if not config_path.exists():
+        return None
+
+    sim_results_path = run_dir / "simulator" / "agg_results.parquet"
+    run_info: dict[str, Any] = {
+        "path": run_dir,
+        "name": run_dir.name,
+        "has_simulator": sim_results_path.exists(),
+        "has_calibrator": (run_dir / "calibrator" / "agg_results.parquet").exists(),
+        "sim_duration": "—",
+        "workload": "Unknown",
+    }
+
+    # Parse timestamp from folder name (format: YYYY_MM_DD_HH_MM_SS)
+    try:
+        run_time = datetime.strptime(run_dir.name, "%Y_%m_%d_%H_%M_%S")
+        run_info["timestamp"] = run_time
+        run_info["time_ago"] = format_time_ago(run_time)
+    except ValueError:
+        run_info["timestamp"] = None
+        run_info["time_ago"] = "Unknown"
+
+    # Try to read metadata for config source
+    if metadata_path.exists():
         try:
-            run_time = datetime.strptime(run_dir.name, "%Y_%m_%d_%H_%M_%S")
-            run_info["timestamp"] = run_time
-            run_info["time_ago"] = format_time_ago(run_time)
-        except ValueError:
-            run_info["timestamp"] = None
-            run_info["time_ago"] = "Unknown"
-
-        # Try to read metadata for config source
-        if metadata_path.exists():
-            try:
-                with open(metadata_path) as f:
-                    metadata = json.load(f)
-                run_info["config_source"] = metadata.get("config_source", "Unknown")
-            except Exception:
-                run_info["config_source"] = "Unknown"
-        else:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            run_info["config_source"] = metadata.get("config_source", "Unknown")
+        except Exception:
             run_info["config_source"] = "Unknown"
+    else:
+        run_info["config_source"] = "Unknown"
 
-        # Read workload and calibration_enabled from config.yaml
+    # Read workload and calibration_enabled from config.yaml
+    try:
+        with open(config_path) as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        workload = config.get("services", {}).get("dc-mock", {}).get("workload", "Unknown")
+        run_info["workload"] = workload
+        # Read calibration_enabled (defaults to False if not present)
+        calibration_enabled = config.get("global", {}).get("calibration_enabled", False)
+        run_info["calibration_enabled"] = calibration_enabled
+    except Exception:
+        run_info["calibration_enabled"] = None  # Unknown
+
+    # Try to read simulation duration from simulator results
+    if sim_results_path.exists():
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
-            workload = config.get("services", {}).get("dc-mock", {}).get("workload", "Unknown")
-            run_info["workload"] = workload
-            # Read calibration_enabled (defaults to False if not present)
-            calibration_enabled = config.get("global", {}).get("calibration_enabled", False)
-            run_info["calibration_enabled"] = calibration_enabled
+            duration_minutes = read_timestamp_span_minutes(sim_results_path)
+            if duration_minutes is not None:
+                run_info["sim_duration"] = format_duration(duration_minutes)
         except Exception:
-            run_info["calibration_enabled"] = None  # Unknown
+            pass
 
-        # Try to read simulation duration from simulator results
-        if sim_results_path.exists():
-            try:
-                df = pd.read_parquet(sim_results_path)
-                if "timestamp" in df.columns and len(df) > 1:
-                    timestamps = pd.to_datetime(df["timestamp"])
-                    duration_minutes = (timestamps.max() - timestamps.min()).total_seconds() / 60
-                    run_info["sim_duration"] = format_duration(duration_minutes)
-            except Exception:
-                pass
+    return run_info
 
-        runs.append(run_info)
 
-    return runs
+def read_timestamp_span_minutes(parquet_path: Path) -> float | None:
+    """Get the span of a parquet file's 'timestamp' column in minutes.
+    
+    Uses the row-group min/max statistics in the file footer when the column is a
+    timestamp and every row group has them, so no data pages are read; otherwise
+    only the 'timestamp' column is loaded.
+    
+    Args:
+        parquet_path: Parquet file with a 'timestamp' column
+    
+    Returns:
+        Span (max - min) in minutes, or None without a 'timestamp' column or with
+        fewer than two rows.
+    """
+    parquet_file = pq.ParquetFile(parquet_path)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    
+    if "timestamp" not in schema.names or metadata.num_rows < 2:
+        return None
+    
+    if pa.types.is_timestamp(schema.field("timestamp").type):
+        column = parquet_file.schema.names.index("timestamp")
+        stats = [metadata.row_group(i).column(column).statistics for i in range(metadata.num_row_groups)]
+        if all(s is not None and s.has_min_max for s in stats):
+            span = max(s.max for s in stats) - min(s.min for s in stats)
+            return span.total_seconds() / 60
+    
+    timestamps = pd.to_datetime(parquet_file.read(columns=["timestamp"])["timestamp"].to_pandas())
+    return (timestamps.max() - timestamps.min()).total_seconds() / 60
 
 
 def format_time_ago(dt: datetime) -> str:
@@ -383,3 +431,78 @@ def get_workload_start_time(run_path: Path) -> pd.Timestamp:
         return start_time
     except Exception as e:
         raise ValueError(f"Could not parse last_task_time '{last_task_time}': {e}")
+
+
+def load_opendt_power(run_path: Path) -> pd.Series:
+    """Load OpenDT power draw per timestamp from a run's aggregated simulator results.
+    
+    Several plots read the same run; the parquet is parsed and grouped once per
+    file version (path, mtime, size) and every caller gets its own copy.
+    
+    Args:
+        run_path: Path to the experiment run directory
+    
+    Returns:
+        Series of summed power draw indexed by (naive UTC) timestamp.
+    
+    Raises:
+        FileNotFoundError: If the aggregated results file is not found.
+    """
+    results_path = run_path / "simulator" / "agg_results.parquet"
+    
+    if not results_path.exists():
+        raise FileNotFoundError(f"OpenDT results not found: {results_path}")
+    
+    stat = results_path.stat()
+    return _load_opendt_power_cached(results_path, stat.st_mtime_ns, stat.st_size).copy()
+
+
+@lru_cache(maxsize=8)
+def _load_opendt_power_cached(results_path: Path, mtime_ns: int, size: int) -> pd.Series:
+    """Parse and group agg_results.parquet (cached; mtime/size only key the cache)."""
+    power = sum_power_by_timestamp(results_path)
+    
+    if power.index.name == "timestamp_absolute":
+        timestamps = pd.to_datetime(power.index, unit="ms", utc=True)
+    else:
+        timestamps = pd.to_datetime(power.index, utc=True)
+    power.index = timestamps.tz_localize(None).rename("timestamp")
+    
+    return power.sort_index()
+
+
+def sum_power_by_timestamp(parquet_path: Path) -> pd.Series:
+    """Sum power draw per distinct raw timestamp of a power parquet file.
+    
+    Reads only the timestamp and power columns and groups them with Arrow's
+    hash aggregation; callers convert the (few) distinct keys to datetimes.
+    
+    Args:
+        parquet_path: Parquet file with a power_draw column and either a
+            'timestamp_absolute' (preferred) or 'timestamp' column
+    
+    Returns:
+        Series of summed power draw indexed by the raw timestamp values, unsorted;
+        the index is named after the column used. Like pandas, NaN and null power
+        values are skipped, all-missing groups sum to 0 and null keys are dropped.
+    """
+    names = pq.read_schema(parquet_path).names
+    timestamp_column = "timestamp_absolute" if "timestamp_absolute" in names else "timestamp"
+    
+    table = pq.read_table(parquet_path, columns=[timestamp_column, METRIC_POWER])
+    table = table.filter(pc.is_valid(table[timestamp_column]))  # pandas drops null keys
+    
+    # Arrow's sum skips nulls but propagates NaN; pandas skips both, so map NaN to null
+    power = table[METRIC_POWER]
+    if pa.types.is_floating(power.type):
+        power = pc.if_else(pc.is_nan(power), pa.scalar(None, power.type), power)
+        table = table.set_column(1, METRIC_POWER, power)
+    sums = table.group_by(timestamp_column).aggregate(
+        [(METRIC_POWER, "sum", pc.ScalarAggregateOptions(min_count=0))]
+    )
+    
+    return pd.Series(
+        sums[f"{METRIC_POWER}_sum"].to_numpy(),
+        index=pd.Index(sums[timestamp_column].to_pandas(), name=timestamp_column),
+        name=METRIC_POWER,
+    )
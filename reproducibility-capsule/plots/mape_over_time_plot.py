@@ -27,10 +27,10 @@ from .config import (
     MAPE_FOOTPRINTER,
     MAPE_NFR_THRESHOLD,
     MAPE_NON_CALIBRATED,
-    METRIC_POWER,
     WORKLOAD_DIR,
 )
-from .data_loader import get_workload_start_time
+from .data_loader import get_workload_start_time, load_opendt_power, sum_power_by_timestamp
+from .processors import block_mean
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
@@ -72,17 +72,17 @@ def generate_mape_over_time_plot(
         Tuple of (avg_mape_calibrated, avg_mape_non_calibrated, sample_count)
     """
     # Load power data from both runs
-    df_c = _load_opendt_power(calibrated_run_path)
-    df_nc = _load_opendt_power(non_calibrated_run_path)
+    df_c = load_opendt_power(calibrated_run_path)
+    df_nc = load_opendt_power(non_calibrated_run_path)
     df_rw = _load_real_world_power(workload)
     
     if len(df_c) == 0 or len(df_nc) == 0 or len(df_rw) == 0:
         raise ValueError("One or more data sources are empty")
     
     # Downsample to align data (real-world is often at higher frequency)
-    df_rw_ds = df_rw.groupby(np.arange(len(df_rw)) // 10).mean()
-    df_nc_ds = df_nc.groupby(np.arange(len(df_nc)) // 2).mean()
-    df_c_ds = df_c.groupby(np.arange(len(df_c)) // 2).mean()
+    df_rw_ds = block_mean(df_rw, 10)
+    df_nc_ds = block_mean(df_nc, 2)
+    df_c_ds = block_mean(df_c, 2)
     
     # Trim to shortest common length
     min_len = min(len(df_nc_ds), len(df_c_ds), len(df_rw_ds))
@@ -104,20 +104,25 @@ def generate_mape_over_time_plot(
     start_time = get_workload_start_time(non_calibrated_run_path)
     timestamps = pd.date_range(start=start_time, periods=min_len, freq="5min")
     
-    # Create plotting DataFrame
-    plot_df = pd.DataFrame({
-        "Real": df_rw_ds.values,
-        "NoCalib": df_nc_shifted.values,
-        "Calib": df_c_shifted.values
-    }, index=timestamps).dropna()
+    # Keep only samples where all three series are present (shift leaves NaN edges)
+    real = df_rw_ds.to_numpy(dtype=np.float64)
+    nc = df_nc_shifted.to_numpy(dtype=np.float64)
+    c = df_c_shifted.to_numpy(dtype=np.float64)
+    valid = ~(np.isnan(real) | np.isnan(nc) | np.isnan(c))
+    timestamps = timestamps[valid]
+    real = real[valid]
+    
+    # Model minus real, computed once for the bias strips and the APE
+    diff_nc = nc[valid] - real
+    diff_c = c[valid] - real
     
     # Calculate bias masks (overestimation = model > real)
-    bias_nc_mask = plot_df["NoCalib"] > plot_df["Real"]
-    bias_c_mask = plot_df["Calib"] > plot_df["Real"]
+    bias_nc_mask = diff_nc > 0
+    bias_c_mask = diff_c > 0
     
     # Calculate rolling MAPE
-    ape_nc = np.abs((plot_df["Real"] - plot_df["NoCalib"]) / plot_df["Real"]) * 100
-    ape_c = np.abs((plot_df["Real"] - plot_df["Calib"]) / plot_df["Real"]) * 100
+    ape_nc = pd.Series(np.abs(diff_nc / real) * 100, index=timestamps)
+    ape_c = pd.Series(np.abs(diff_c / real) * 100, index=timestamps)
     
     smooth_mape_nc = ape_nc.rolling(ROLLING_WINDOW).mean().dropna()
     smooth_mape_c = ape_c.rolling(ROLLING_WINDOW).mean().dropna()
@@ -131,17 +136,19 @@ def generate_mape_over_time_plot(
     y_nc_bottom = y_top - strip_height  # Top strip for No Calibration
     y_c_bottom = y_nc_bottom - strip_height  # Bottom strip for Calibrated
     
+    # Strips are rasterized: the alternating masks would otherwise become thousands
+    # of vector subpaths in the PDF (the MAPE lines below stay vector)
     # No Calibration strip (purple) - dark = overestimating, light = underestimating
-    ax.fill_between(plot_df.index, y_nc_bottom, y_top, where=bias_nc_mask,
-                    color=MAPE_NON_CALIBRATED, alpha=1.0, linewidth=0, step='mid', zorder=1)
-    ax.fill_between(plot_df.index, y_nc_bottom, y_top, where=~bias_nc_mask,
-                    color=MAPE_NON_CALIBRATED, alpha=0.4, linewidth=0, step='mid', zorder=1)
+    ax.fill_between(timestamps, y_nc_bottom, y_top, where=bias_nc_mask,
+                    color=MAPE_NON_CALIBRATED, alpha=1.0, linewidth=0, step='mid', zorder=1, rasterized=True)
+    ax.fill_between(timestamps, y_nc_bottom, y_top, where=~bias_nc_mask,
+                    color=MAPE_NON_CALIBRATED, alpha=0.4, linewidth=0, step='mid', zorder=1, rasterized=True)
     
     # Calibrated strip (green) - dark = overestimating, light = underestimating
-    ax.fill_between(plot_df.index, y_c_bottom, y_nc_bottom, where=bias_c_mask,
-                    color=MAPE_CALIBRATED, alpha=1.0, linewidth=0, step='mid', zorder=1)
-    ax.fill_between(plot_df.index, y_c_bottom, y_nc_bottom, where=~bias_c_mask,
-                    color=MAPE_CALIBRATED, alpha=0.4, linewidth=0, step='mid', zorder=1)
+    ax.fill_between(timestamps, y_c_bottom, y_nc_bottom, where=bias_c_mask,
+                    color=MAPE_CALIBRATED, alpha=1.0, linewidth=0, step='mid', zorder=1, rasterized=True)
+    ax.fill_between(timestamps, y_c_bottom, y_nc_bottom, where=~bias_c_mask,
+                    color=MAPE_CALIBRATED, alpha=0.4, linewidth=0, step='mid', zorder=1, rasterized=True)
     
     # White separator between strips
     ax.axhline(y=y_nc_bottom, color='white', linewidth=1, zorder=2)
@@ -185,7 +192,7 @@ def generate_mape_over_time_plot(
     ax.set_xlabel("Time [day/month]", fontsize=FONT_SIZE_AXIS_DESCRIPTIONS)
     ax.set_ylim(0, y_top)
     ax.set_yticks([0, 5, 10, 15])
-    ax.set_xlim(plot_df.index[0], plot_df.index[-1])
+    ax.set_xlim(timestamps[0], timestamps[-1])
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, 0.92), ncol=2, framealpha=0.95, fontsize=FONT_SIZE_LEGEND)
     ax.tick_params(axis='both', labelsize=FONT_SIZE_AXIS_LABELS)
     
@@ -208,30 +215,11 @@ def generate_mape_over_time_plot(
     # Return statistics
     avg_mape_c = float(smooth_mape_c.mean())
     avg_mape_nc = float(smooth_mape_nc.mean())
-    sample_count = len(plot_df)
+    sample_count = len(real)
     
     return avg_mape_c, avg_mape_nc, sample_count
 
 
-def _load_opendt_power(run_path: Path) -> pd.Series:
-    """Load OpenDT power data from aggregated results."""
-    results_path = run_path / "simulator" / "agg_results.parquet"
-    
-    if not results_path.exists():
-        raise FileNotFoundError(f"OpenDT results not found: {results_path}")
-    
-    df = pd.read_parquet(results_path)
-    
-    if "timestamp_absolute" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp_absolute"], unit="ms", utc=True)
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-    else:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-    
-    return df.groupby("timestamp")[METRIC_POWER].sum()
-
-
 def _load_real_world_power(workload: str) -> pd.Series:
     """Load real-world power consumption data."""
     rw_path = WORKLOAD_DIR / workload / "consumption.parquet"
@@ -239,33 +227,43 @@ def _load_real_world_power(workload: str) -> pd.Series:
     if not rw_path.exists():
         raise FileNotFoundError(f"Real world data not found: {rw_path}")
     
-    df = pd.read_parquet(rw_path)
-    
-    if "timestamp_absolute" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp_absolute"], unit="ms")
-    elif "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    power = sum_power_by_timestamp(rw_path)
+    power.index = pd.to_datetime(power.index, unit="ms").rename("timestamp")
     
-    return df.groupby("timestamp")[METRIC_POWER].sum()
+    return power.sort_index()
 
 
 def _find_optimal_shift(sim_data: pd.Series, real_data: pd.Series) -> int:
     """Find optimal time shift to minimize MAPE.
     
     Searches +/- 12 steps (approximately +/- 1 hour at 5-min resolution).
+    Both series must share the same positional index (as after trimming); each
+    shift compares overlapping array slices instead of shifting and realigning
+    the Series.
     """
+    sim = sim_data.to_numpy(dtype=np.float64)
+    real = real_data.to_numpy(dtype=np.float64)
+    n = len(sim)
+    
     best_shift = 0
     best_mape = 100.0
     
     for shift in range(-12, 13):
-        sim_shifted = sim_data.shift(shift).dropna()
-        rw_aligned = real_data.loc[sim_shifted.index]
+        # Shifting by the whole length leaves no overlap (all-NaN after the shift)
+        if abs(shift) >= n:
+            continue
+        
+        # Equivalent of sim_data.shift(shift) aligned with real_data, minus the NaN edge
+        rw_aligned = real[max(0, shift):n + min(0, shift)]
+        sim_shifted = sim[max(0, -shift):n + min(0, -shift)]
         
-        mask = rw_aligned != 0
-        if mask.sum() == 0:
+        mask = (rw_aligned != 0) & ~np.isnan(sim_shifted)
+        if not mask.any():
             continue
-            
-        mape = np.mean(np.abs((rw_aligned[mask] - sim_shifted[mask]) / rw_aligned[mask])) * 100
+        
+        ape = np.abs((rw_aligned[mask] - sim_shifted[mask]) / rw_aligned[mask])
+        ape = ape[~np.isnan(ape)]  # Skip NaN like the pandas mean did
+        mape = ape.mean() * 100 if len(ape) else np.nan
         
         if mape < best_mape:
             best_mape = mape
@@ -24,7 +24,8 @@ from .config import (
     POWER_OPENDT,
     WORKLOAD_DIR,
 )
-from .data_loader import get_workload_start_time
+from .data_loader import get_workload_start_time, load_opendt_power
+from .processors import block_mean
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
@@ -101,23 +102,7 @@ def load_opendt_results(run_path: Path) -> pd.Series:  # type: ignore[type-arg]
     Raises:
         FileNotFoundError: If results file not found.
     """
-    results_path = run_path / "simulator" / "agg_results.parquet"
-
-    if not results_path.exists():
-        raise FileNotFoundError(f"OpenDT results not found: {results_path}")
-
-    df = pd.read_parquet(results_path)
-
-    # Handle timestamp conversion
-    if "timestamp_absolute" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp_absolute"], unit="ms", utc=True)
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-    else:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-
-    result: pd.Series = df.groupby("timestamp")[METRIC_POWER].sum()  # type: ignore[type-arg, assignment]
-    return result
+    return load_opendt_power(run_path)
 
 
 def interpolate_to_1min(series: pd.Series) -> pd.Series:  # type: ignore[type-arg]
@@ -132,8 +117,7 @@ def interpolate_to_1min(series: pd.Series) -> pd.Series:  # type: ignore[type-ar
 
 def average_to_5min(series: pd.Series) -> pd.Series:  # type: ignore[type-arg]
     """Average 1-min data to 5-min intervals."""
-    result: pd.Series = series.groupby(np.arange(len(series)) // 5).mean()  # type: ignore[type-arg, assignment]
-    return result
+    return block_mean(series, 5)
 
 
 def calculate_mape(ground_truth: pd.Series, simulation: pd.Series) -> float:  # type: ignore[type-arg]
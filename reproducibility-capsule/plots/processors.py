@@ -9,6 +9,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from .data_loader import (
@@ -630,3 +631,28 @@ def _get_power_in_window(
         result.append((row["absolute_time"], row["power_draw"], typical_delta))
     
     return result
+
+
+def block_mean(series: pd.Series, size: int) -> pd.Series:
+    """Average consecutive fixed-size blocks of a series (downsampling).
+    
+    Equivalent to ``series.groupby(np.arange(len(series)) // size).mean()``: NaNs
+    are skipped, the last block may be shorter, and the result is indexed
+    0..n_blocks-1. The blocks are contiguous, so one strided reduction replaces
+    the hash groupby.
+    
+    Args:
+        series: Values to downsample
+        size: Number of consecutive values per block
+    
+    Returns:
+        Series of block means.
+    """
+    values = series.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(values)
+    starts = np.arange(0, len(values), size)
+    
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    counts = np.add.reduceat(valid, starts)
+    with np.errstate(invalid="ignore"):
+        return pd.Series(sums / counts, name=series.name)
@@ -36,7 +36,7 @@ from .config import (
     SUST_PERFORMANCE,
     WORKLOAD_DIR,
 )
-from .data_loader import get_workload_start_time
+from .data_loader import get_workload_start_time, load_opendt_power
 from .processors import process_flops_data
 
 if TYPE_CHECKING:
@@ -75,7 +75,7 @@ def generate_efficiency_plot(
     
     # Load power data for all three sources (keep at raw resolution)
     fp_power, rw_power = _load_baseline_power(workload, base_dt)
-    odt_power = _load_opendt_power(run_path)
+    odt_power = load_opendt_power(run_path)
     
     # Align power data at raw resolution (1-minute interpolation)
     raw_power_data = _align_power_data(fp_power, rw_power, odt_power)
@@ -233,24 +233,6 @@ def _load_baseline_power(
     return fp_series, rw_series
 
 
-def _load_opendt_power(run_path: Path) -> pd.Series:
-    """Load OpenDT power data from aggregated results."""
-    results_path = run_path / "simulator" / "agg_results.parquet"
-    
-    if not results_path.exists():
-        raise FileNotFoundError(f"OpenDT results not found: {results_path}")
-    
-    df = pd.read_parquet(results_path)
-    
-    if "timestamp_absolute" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp_absolute"], unit="ms", utc=True)
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-    else:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
-    return df.groupby("timestamp")[METRIC_POWER].sum()
-
-
 def _align_power_data(
     fp_power: pd.Series,
     rw_power: pd.Series,
@@ -0,0 +1 @@
+"""Tests for the reproducibility capsule plots."""
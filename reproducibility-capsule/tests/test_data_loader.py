@@ -0,0 +1,88 @@
+"""Tests for the capsule data loader helpers."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from plots.data_loader import read_timestamp_span_minutes, sum_power_by_timestamp
+
+START = datetime(2022, 10, 6, 22, 0)
+
+
+@pytest.fixture
+def timestamps() -> pa.Array:
+    """Three timestamps spanning 90 minutes."""
+    return pa.array(
+        [START.replace(minute=30), START, START.replace(hour=23, minute=30)], pa.timestamp("ms")
+    )
+
+
+def test_timestamp_span_from_statistics(tmp_path, timestamps):
+    """Test the span is taken from footer statistics across row groups."""
+    path = tmp_path / "agg_results.parquet"
+    pq.write_table(pa.table({"timestamp": timestamps}), path, row_group_size=1)
+
+    assert read_timestamp_span_minutes(path) == 90.0
+
+
+def test_timestamp_span_without_statistics(tmp_path, timestamps):
+    """Test the timestamp column is read when the footer has no statistics."""
+    path = tmp_path / "agg_results.parquet"
+    pq.write_table(pa.table({"timestamp": timestamps}), path, write_statistics=False)
+
+    assert read_timestamp_span_minutes(path) == 90.0
+
+
+def test_timestamp_span_non_timestamp_column(tmp_path):
+    """Test integer timestamp columns fall back to reading the column."""
+    path = tmp_path / "agg_results.parquet"
+    pq.write_table(pa.table({"timestamp": pa.array([0, 3_600_000_000_000, 60_000_000_000])}), path)
+
+    assert read_timestamp_span_minutes(path) == 60.0
+
+
+def test_timestamp_span_missing_or_too_short(tmp_path, timestamps):
+    """Test files without a timestamp column or with one row have no span."""
+    no_column = tmp_path / "no_column.parquet"
+    one_row = tmp_path / "one_row.parquet"
+    pq.write_table(pa.table({"power_draw": [1.0, 2.0]}), no_column)
+    pq.write_table(pa.table({"timestamp": timestamps[:1]}), one_row)
+
+    assert read_timestamp_span_minutes(no_column) is None
+    assert read_timestamp_span_minutes(one_row) is None
+
+
+def test_sum_power_matches_pandas_groupby(tmp_path):
+    """Test per-timestamp sums skip NaN/null power and null keys like pandas."""
+    path = tmp_path / "consumption.parquet"
+    table = pa.table(
+        {
+            "timestamp": pa.array([1, 1, 2, 2, None, 3, 3], pa.int64()),
+            "power_draw": pa.array([1.0, np.nan, 3.0, 4.0, 5.0, None, np.nan]),
+        }
+    )
+    pq.write_table(table, path)  # NaN stays NaN (pandas would write it as null)
+
+    expected = table.to_pandas().groupby("timestamp")["power_draw"].sum()
+    result = sum_power_by_timestamp(path).sort_index()
+
+    assert result.to_dict() == {1: 1.0, 2: 7.0, 3: 0.0}
+    assert result.to_dict() == expected.to_dict()
+    assert result.index.name == "timestamp"
+
+
+def test_sum_power_prefers_absolute_timestamps(tmp_path):
+    """Test timestamp_absolute is used as the key when present."""
+    path = tmp_path / "agg_results.parquet"
+    pd.DataFrame(
+        {"timestamp": [0, 0, 0], "timestamp_absolute": [10, 10, 20], "power_draw": [1.0, 2.0, 4.0]}
+    ).to_parquet(path)
+
+    result = sum_power_by_timestamp(path)
+
+    assert result.index.name == "timestamp_absolute"
+    assert result.sort_index().to_dict() == {10: 3.0, 20: 4.0}
@@ -0,0 +1,27 @@
+"""Tests for the MAPE over time plot helpers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from plots.mape_over_time_plot import _find_optimal_shift  # noqa: E402
+
+
+def test_find_optimal_shift_recovers_lag():
+    """Test the shift that best aligns a lagged copy of the real data is found."""
+    real = pd.Series(np.sin(np.linspace(0, 12, 200)) + 2.0)
+    sim = real.shift(-3).bfill().ffill()
+
+    assert _find_optimal_shift(sim, real) == 3
+
+
+@pytest.mark.parametrize("n", [1, 5, 7, 10, 12])
+def test_find_optimal_shift_short_series(n):
+    """Test series shorter than the +/- 12 step search window do not fail."""
+    real = pd.Series(np.arange(1.0, n + 1))
+    sim = real * 1.1
+
+    shift = _find_optimal_shift(sim, real)
+    assert -n < shift < n
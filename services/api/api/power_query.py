@@ -106,8 +106,12 @@ class PowerDataQuery:
 
         # Convert to response model
         data_points = []
-        for _, row in aligned_df.iterrows():
-            timestamp = row["timestamp"]
+        for timestamp, simulated_power, actual_power in zip(
+            aligned_df["timestamp"].tolist(),
+            aligned_df["simulated_power"].tolist(),
+            aligned_df["actual_power"].tolist(),
+            strict=True,
+        ):
             if isinstance(timestamp, pd.Timestamp):
                 timestamp_dt = timestamp.to_pydatetime()
             else:
@@ -116,8 +120,8 @@ class PowerDataQuery:
             data_points.append(
                 PowerDataPoint(
                     timestamp=timestamp_dt,
-                    simulated_power=float(row["simulated_power"]),
-                    actual_power=float(row["actual_power"]),
+                    simulated_power=float(simulated_power),
+                    actual_power=float(actual_power),
                 )
             )
 
@@ -4,6 +4,7 @@ Uses ProcessPoolExecutor for parallel execution and manages directory structure.
 """
 
 import logging
+from collections.abc import Sequence
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,7 +13,7 @@ from typing import Any, cast
 
 import numpy as np
 import pandas as pd
-from odt_common.models import Task, Topology
+from odt_common.models import TaskRecord, Topology
 from odt_common.odc_runner import OpenDCRunner
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ def _run_single_simulation(
     sim_number: int,
     param_value: float,
     topology: Topology,
-    tasks: list[Task],
+    tasks: Sequence[TaskRecord],
     sim_dir: Path,
     simulated_time: datetime,
     timeout_seconds: int,
@@ -147,7 +148,7 @@ class CalibrationEngine:
     def run_calibration_sweep(
         self,
         base_topology: Topology,
-        tasks: list[Task],
+        tasks: Sequence[TaskRecord],
         property_path: str,
         min_value: float,
         max_value: float,
@@ -146,7 +146,7 @@ class CalibrationService:
                     message_type = value.get("message_type")
 
                     if message_type == "task":
-                        task = Task(**value["task"])
+                        task = Task.model_validate(value["task"])
                         self.task_accumulator.add_task(task)
                         self.tasks_processed += 1
 
@@ -92,7 +92,7 @@ class PowerTracker:
                     break
 
                 try:
-                    consumption = Consumption(**message.value)
+                    consumption = Consumption.model_validate(message.value)
 
                     with self._lock:
                         self.power_readings.append((consumption.timestamp, consumption.power_draw))
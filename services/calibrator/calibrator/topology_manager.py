@@ -99,7 +99,7 @@ class TopologyManager:
                 try:
                     if message.topic == self.dc_topology_topic:
                         # Real topology (wrapped in TopologySnapshot)
-                        snapshot = TopologySnapshot(**message.value)
+                        snapshot = TopologySnapshot.model_validate(message.value)
                         with self._lock:
                             self._real_topology = snapshot.topology
                             # Initialize sim topology if not set
@@ -110,7 +110,7 @@ class TopologyManager:
 
                     elif message.topic == self.sim_topology_topic:
                         # Simulated topology (raw Topology)
-                        topology = Topology(**message.value)
+                        topology = Topology.model_validate(message.value)
                         with self._lock:
                             self._sim_topology = topology
                         logger.debug("Updated simulated topology")
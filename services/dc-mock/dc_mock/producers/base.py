@@ -8,6 +8,7 @@ from typing import Any
 from kafka import KafkaProducer
 from odt_common.utils import get_kafka_producer
 from odt_common.utils.kafka import send_message
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
@@ -62,11 +63,15 @@ class BaseProducer(ABC):
             self._producer = get_kafka_producer(self.kafka_bootstrap_servers)
         return self._producer
 
-    def emit_message(self, message: dict[str, Any], key: str | None = None) -> None:
+    def emit_message(self, message: dict[str, Any] | BaseModel, key: str | None = None) -> None:
         """Emit a message to Kafka.
 
+        Messages are sent asynchronously so the producer can batch them; call
+        ``flush()`` to wait until everything emitted so far is delivered.
+
         Args:
-            message: Message payload (will be JSON serialized)
+            message: Message payload (will be JSON serialized); models are encoded
+                directly, without an intermediate ``model_dump()``
             key: Optional message key
         """
         try:
@@ -75,6 +80,7 @@ class BaseProducer(ABC):
                 topic=self.topic,
                 message=message,
                 key=key,
+                wait=False,  # Batched; delivery is guaranteed by flush()
             )
         except Exception as e:
             logger.error(f"Failed to emit message to {self.topic}: {e}", exc_info=True)
@@ -8,8 +8,10 @@ import threading
 import time
 from datetime import UTC
 
-import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from odt_common import Consumption, WorkloadContext
+from odt_common.models.columns import drop_invalid_rows
 
 from dc_mock.producers.base import BaseProducer
 
@@ -69,26 +71,24 @@ class PowerProducer(BaseProducer):
             logger.warning(f"Consumption file not found: {self.workload_context.consumption_file}")
             return []
 
-        consumption_df = pd.read_parquet(self.workload_context.consumption_file)
-        logger.info(f"Loaded {len(consumption_df)} consumption records")
+        consumption_table = pq.read_table(self.workload_context.consumption_file)
+        logger.info(f"Loaded {consumption_table.num_rows} consumption records")
 
         # Convert relative timestamps to absolute timestamps
         offset_ms = self.workload_context.consumption_offset_ms
         logger.info(f"Converting consumption timestamps with offset: {offset_ms}ms")
 
         # Formula: absolute_time_ms = earliest_task_time_ms + relative_ms + offset_ms
-        consumption_df["timestamp"] = (
-            self.earliest_task_time_ms + consumption_df["timestamp"] + offset_ms
+        absolute_ms = pc.add(consumption_table["timestamp"], self.earliest_task_time_ms + offset_ms)
+        consumption_table = consumption_table.set_column(
+            consumption_table.schema.get_field_index("timestamp"), "timestamp", absolute_ms
         )
 
-        # Convert to Pydantic models
-        consumption_records = []
-        for _, row in consumption_df.iterrows():
-            try:
-                consumption_records.append(Consumption(**row.to_dict()))
-            except Exception as e:
-                logger.warning(f"Failed to parse consumption record: {e}")
-
+        # Filter out rows the model would reject, then build the rest column-wise
+        consumption_table, dropped = drop_invalid_rows(consumption_table, Consumption)
+        if dropped:
+            logger.warning(f"Skipped {dropped} invalid consumption records")
+        consumption_records = Consumption.from_arrow_table(consumption_table)
         logger.info(f"Parsed {len(consumption_records)} consumption records")
         if consumption_records:
             first_time = consumption_records[0].timestamp
@@ -140,9 +140,6 @@ class PowerProducer(BaseProducer):
                             break
                 # If speed_factor == -1, don't sleep (max speed)
 
-                # Emit consumption event
-                consumption_msg = consumption.model_dump(mode="json")
-
                 # Debug: Log first few power emissions
                 if i < 5 or (i + 1) % 100 == 0:
                     logger.info(
@@ -152,7 +149,7 @@ class PowerProducer(BaseProducer):
                     )
 
                 self.emit_message(
-                    message=consumption_msg,
+                    message=consumption,
                     key=None,  # No key for consumption
                 )
 
@@ -3,7 +3,6 @@
 Periodically publishes datacenter topology to Kafka.
 """
 
-import json
 import logging
 import threading
 from datetime import datetime
@@ -68,11 +67,9 @@ class TopologyProducer(BaseProducer):
         if not self.topology_file.exists():
             raise FileNotFoundError(f"Topology file not found: {self.topology_file}")
 
-        with open(self.topology_file) as f:
-            topology_data = json.load(f)
-
         try:
-            topology = Topology(**topology_data)
+            # Parse and validate in one pass (pydantic-core's JSON parser, no dict stage)
+            topology = Topology.model_validate_json(self.topology_file.read_bytes())
             logger.debug(f"Loaded topology with {len(topology.clusters)} cluster(s)")
             logger.debug(f"  Total hosts: {topology.total_host_count()}")
             logger.debug(f"  Total cores: {topology.total_core_count()}")
@@ -100,7 +97,7 @@ class TopologyProducer(BaseProducer):
             # Publish immediately on startup
             snapshot = TopologySnapshot(timestamp=datetime.now(), topology=topology)
             self.emit_message(
-                message=snapshot.model_dump(mode="json"),
+                message=snapshot,
                 key="datacenter",  # Single key for compaction
             )
             self.flush()
@@ -117,7 +114,7 @@ class TopologyProducer(BaseProducer):
                     topology = self.load_topology()
                     snapshot = TopologySnapshot(timestamp=datetime.now(), topology=topology)
                     self.emit_message(
-                        message=snapshot.model_dump(mode="json"),
+                        message=snapshot,
                         key="datacenter",
                     )
                     self.flush()
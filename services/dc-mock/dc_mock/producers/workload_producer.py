@@ -6,10 +6,13 @@ Streams task/workload events to Kafka with proper timing.
 import logging
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 
-import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from odt_common import Fragment, Task, WorkloadContext
+from odt_common.models.columns import drop_invalid_rows
 
 from dc_mock.producers.base import BaseProducer
 
@@ -68,41 +71,33 @@ class WorkloadProducer(BaseProducer):
         logger.info("Loading task and fragment data...")
 
         # Load tasks
-        tasks_df = pd.read_parquet(self.workload_context.tasks_file)
-        logger.info(f"Loaded {len(tasks_df)} tasks")
+        tasks_table = pq.read_table(self.workload_context.tasks_file)
+        logger.info(f"Loaded {tasks_table.num_rows} tasks")
 
         # Get earliest task submission time
-        earliest_task_time = tasks_df["submission_time"].min().to_pydatetime()
+        earliest_task_time = pc.min(tasks_table["submission_time"]).as_py()
         logger.info(f"Earliest task submission time: {earliest_task_time}")
 
         # Load fragments
-        fragments_df = pd.read_parquet(self.workload_context.fragments_file)
-        logger.info(f"Loaded {len(fragments_df)} fragments")
+        fragments_table = pq.read_table(self.workload_context.fragments_file)
+        logger.info(f"Loaded {fragments_table.num_rows} fragments")
+
+        # Filter out rows the models would reject instead of failing the whole load
+        tasks_table, dropped = drop_invalid_rows(tasks_table, Task)
+        if dropped:
+            logger.warning(f"Skipped {dropped} invalid tasks")
+        fragments_table, dropped = drop_invalid_rows(fragments_table, Fragment)
+        if dropped:
+            logger.warning(f"Skipped {dropped} invalid fragments")
 
         # Aggregate fragments by task_id
         logger.info("Aggregating fragments into tasks...")
-        fragments_by_task = fragments_df.groupby("id")
+        fragments_by_task: dict[int, list[Fragment]] = defaultdict(list)
+        for fragment in Fragment.from_arrow_table(fragments_table):
+            fragments_by_task[fragment.task_id].append(fragment)
 
         # Create Task objects with nested fragments
-        tasks = []
-        for _, task_row in tasks_df.iterrows():
-            task_dict = task_row.to_dict()
-            task_id = task_dict["id"]
-
-            # Get fragments for this task
-            if task_id in fragments_by_task.groups:
-                task_fragments_df = fragments_by_task.get_group(task_id)
-                fragments = [
-                    Fragment(**frag_row.to_dict()) for _, frag_row in task_fragments_df.iterrows()
-                ]
-                task_dict["fragments"] = fragments
-            else:
-                task_dict["fragments"] = []
-
-            try:
-                tasks.append(Task(**task_dict))
-            except Exception as e:
-                logger.warning(f"Failed to parse task {task_id}: {e}")
+        tasks = Task.from_arrow_table(tasks_table, fragments_by_task)
 
         logger.info(f"Created {len(tasks)} task aggregates")
         total_fragments = sum(len(t.fragments) for t in tasks)
@@ -245,7 +240,7 @@ class WorkloadProducer(BaseProducer):
                 task_msg = {
                     "message_type": "task",
                     "timestamp": task.submission_time.isoformat(),
-                    "task": task.model_dump(mode="json"),
+                    "task": task,  # Encoded by the producer's JSON serializer
                 }
 
                 # Debug: Log first few task emissions
@@ -303,11 +303,9 @@ class SimulationService:
                 # Update metadata with new timestamp and cached flag
                 metadata_file = run_dir / "metadata.json"
                 metadata = json.loads(metadata_file.read_text())
-                metadata["simulated_time"] = aligned_simulated_time.replace(
-                    microsecond=0
-                ).isoformat()
+                metadata["simulated_time"] = aligned_simulated_time.isoformat(timespec="seconds")
                 metadata["wall_clock_time"] = (
-                    datetime.now(UTC).replace(microsecond=0, tzinfo=None).isoformat()
+                    datetime.now(UTC).replace(tzinfo=None).isoformat(timespec="seconds")
                 )
                 metadata["cached"] = True
                 metadata_file.write_text(json.dumps(metadata, indent=2))
@@ -367,10 +365,12 @@ class SimulationService:
 
             if message_type == "task":
                 # Extract task
-                task = Task(**message_data["task"])
+                task = Task.model_validate(message_data["task"])
                 logger.debug(
-                    f"Received task {task.id} at {task.submission_time} "
-                    f"with {len(task.fragments)} fragments"
+                    "Received task %s at %s with %d fragments",
+                    task.id,
+                    task.submission_time,
+                    len(task.fragments),
                 )
 
                 # Add to accumulator
@@ -380,7 +380,7 @@ class SimulationService:
             elif message_type == "heartbeat":
                 # Parse heartbeat timestamp
                 heartbeat_time = datetime.fromisoformat(message_data["timestamp"])
-                logger.debug(f"Received heartbeat at {heartbeat_time}")
+                logger.debug("Received heartbeat at %s", heartbeat_time)
 
                 # Check if we should trigger simulation
                 if self.task_accumulator.should_simulate(heartbeat_time, self.simulation_frequency):
@@ -400,7 +400,7 @@ class SimulationService:
         """
         try:
             # Parse into TopologySnapshot model
-            topology_snapshot = TopologySnapshot(**message_data)
+            topology_snapshot = TopologySnapshot.model_validate(message_data)
 
             logger.debug(
                 f"📡 Received topology snapshot (timestamp: {topology_snapshot.timestamp})"
@@ -426,7 +426,7 @@ class SimulationService:
         """
         try:
             # Parse into Topology model (not TopologySnapshot)
-            topology = Topology(**message_data)
+            topology = Topology.model_validate(message_data)
 
             logger.info(
                 f"🔄 Received simulated topology update: {len(topology.clusters)} cluster(s)"
@@ -440,8 +440,7 @@ class SimulationService:
             logger.info("🗑️  Cleared result cache due to topology update")
 
             # Log update details
-            total_hosts = sum(host.count for cluster in topology.clusters for host in cluster.hosts)
-            logger.info(f"   Total hosts: {total_hosts}")
+            logger.info(f"   Total hosts: {topology.total_host_count()}")
 
         except Exception as e:
             logger.error(f"Error processing topology update message: {e}", exc_info=True)
@@ -1,6 +1,7 @@
 """Test task accumulation and frequency-based triggering."""
 
 # Import the TaskAccumulator from main.py
+import pickle
 import sys
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -217,5 +218,43 @@ def test_multiple_simulations():
     assert len(accumulator.get_all_tasks()) == 2  # Accumulates all tasks
 
 
+def test_get_all_tasks_snapshot():
+    """Test get_all_tasks is a stable snapshot that later tasks do not extend."""
+    accumulator = TaskAccumulator()
+    for i in range(3):
+        accumulator.add_task(
+            Task(
+                id=i + 1,
+                submission_time=datetime(2024, 1, 1, 22, i, 0, tzinfo=UTC),
+                duration=5000,
+                cpu_count=4,
+                cpu_capacity=2400.0,
+                mem_capacity=8000,
+                fragments=[Fragment(id=i + 1, duration=5000, cpu_count=4, cpu_usage=50.0)],
+            )
+        )
+
+    tasks = accumulator.get_all_tasks()
+    accumulator.add_task(
+        Task(
+            id=4,
+            submission_time=datetime(2024, 1, 1, 22, 3, 0, tzinfo=UTC),
+            duration=5000,
+            cpu_count=4,
+            cpu_capacity=2400.0,
+            mem_capacity=8000,
+            fragments=[],
+        )
+    )
+
+    assert len(tasks) == 3
+    assert [t.id for t in tasks] == [1, 2, 3]
+    assert tasks[-1].id == 3
+    assert [t.id for t in tasks[1:]] == [2, 3]
+    with pytest.raises(IndexError):
+        tasks[3]
+    assert [t.id for t in pickle.loads(pickle.dumps(tasks))] == [1, 2, 3]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])